@@ -1,14 +1,16 @@
 import os
 from setuptools import setup, find_packages
 
-# Read version from _version.py (exec, not import — package isn't installed yet)
+# Read version from _version.py (exec, not import — package isn't installed yet).
+# _version.py is stdlib-only; exec it into its own namespace.
 version_file = os.path.join(os.path.dirname(__file__), "wingather", "_version.py")
+version_ns = {}
 with open(version_file) as f:
-    exec(f.read())
+    exec(f.read(), version_ns)
 
 setup(
     name="wingather",
-    version=get_pip_version() if "get_pip_version" in locals() else "0.0.0",
+    version=version_ns.get("PIP_VERSION", "0.0.0"),
     description="Windows admin and security tool for discovering, recovering, and managing hidden or inaccessible windows",
     long_description=open("README.md", encoding="utf-8").read(),
     long_description_content_type="text/markdown",
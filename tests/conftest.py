@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """The CLI argument parser, built once and shared across a test module."""
+    from wingather.cli import build_parser
+    return build_parser()
+
+
+@pytest.fixture(autouse=True)
+def isolated_state_dir(tmp_path, monkeypatch):
+    """Point wingather's state dir at a temp dir and start with no sig cache.
+
+    Also drops any cached OS roots so one test's environment can't leak
+    into the next.
+    """
+    import wingather.core
+    wingather.core._os_roots.cache_clear()
+    state_dir = tmp_path / 'state'
+    monkeypatch.setattr(wingather.core, '_get_state_dir', lambda: state_dir)
+    monkeypatch.setattr(wingather.core, '_sig_memo', None)
+    return state_dir
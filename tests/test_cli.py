@@ -1,14 +1,16 @@
 """Tests for CLI argument parsing."""
 
+import subprocess
+import sys
+
 import pytest
-from wingather.cli import build_parser
 
 
 class TestCLIParsing:
     """Verify argument parsing produces correct values."""
 
-    def test_defaults(self):
-        args = build_parser().parse_args([])
+    def test_defaults(self, parser):
+        args = parser.parse_args([])
         assert not args.list_only
         assert not args.dry_run
         assert not args.show_hidden
@@ -24,88 +26,88 @@ class TestCLIParsing:
         assert not args.gather_all
         assert not args.verbose
 
-    def test_dry_run_short(self):
-        args = build_parser().parse_args(['-n'])
+    def test_dry_run_short(self, parser):
+        args = parser.parse_args(['-n'])
         assert args.dry_run
 
-    def test_dry_run_long(self):
-        args = build_parser().parse_args(['--dry-run'])
+    def test_dry_run_long(self, parser):
+        args = parser.parse_args(['--dry-run'])
         assert args.dry_run
 
-    def test_list_only(self):
-        args = build_parser().parse_args(['--list-only'])
+    def test_list_only(self, parser):
+        args = parser.parse_args(['--list-only'])
         assert args.list_only
 
-    def test_list_only_short(self):
-        args = build_parser().parse_args(['-l'])
+    def test_list_only_short(self, parser):
+        args = parser.parse_args(['-l'])
         assert args.list_only
 
-    def test_verbose(self):
-        args = build_parser().parse_args(['-v'])
+    def test_verbose(self, parser):
+        args = parser.parse_args(['-v'])
         assert args.verbose
 
-    def test_monitor_index(self):
-        args = build_parser().parse_args(['-m', '2'])
+    def test_monitor_index(self, parser):
+        args = parser.parse_args(['-m', '2'])
         assert args.monitor == 2
 
-    def test_json_output(self):
-        args = build_parser().parse_args(['--json'])
+    def test_json_output(self, parser):
+        args = parser.parse_args(['--json'])
         assert args.json_output
 
-    def test_show_hidden(self):
-        args = build_parser().parse_args(['--show-hidden'])
+    def test_show_hidden(self, parser):
+        args = parser.parse_args(['--show-hidden'])
         assert args.show_hidden
 
-    def test_include_virtual(self):
-        args = build_parser().parse_args(['--include-virtual'])
+    def test_include_virtual(self, parser):
+        args = parser.parse_args(['--include-virtual'])
         assert args.include_virtual
 
-    def test_filter_pattern(self):
-        args = build_parser().parse_args(['-f', '*chrome*'])
+    def test_filter_pattern(self, parser):
+        args = parser.parse_args(['-f', '*chrome*'])
         assert args.filter == '*chrome*'
 
-    def test_exclude_pattern(self):
-        args = build_parser().parse_args(['-x', '*debug*'])
+    def test_exclude_pattern(self, parser):
+        args = parser.parse_args(['-x', '*debug*'])
         assert args.exclude == '*debug*'
 
-    def test_exclude_process_single(self):
-        args = build_parser().parse_args(['-xp', 'notepad.exe'])
+    def test_exclude_process_single(self, parser):
+        args = parser.parse_args(['-xp', 'notepad.exe'])
         assert args.exclude_process == ['notepad.exe']
 
-    def test_exclude_process_multiple(self):
-        args = build_parser().parse_args(['-xp', 'notepad.exe', '-xp', 'calc.exe'])
+    def test_exclude_process_multiple(self, parser):
+        args = parser.parse_args(['-xp', 'notepad.exe', '-xp', 'calc.exe'])
         assert args.exclude_process == ['notepad.exe', 'calc.exe']
 
-    def test_trust_single(self):
-        args = build_parser().parse_args(['-tp', 'myapp.exe'])
+    def test_trust_single(self, parser):
+        args = parser.parse_args(['-tp', 'myapp.exe'])
         assert args.trust == ['myapp.exe']
 
-    def test_trust_multiple(self):
-        args = build_parser().parse_args(['-tp', 'app1.exe', '-tp', 'app2*'])
+    def test_trust_multiple(self, parser):
+        args = parser.parse_args(['-tp', 'app1.exe', '-tp', 'app2*'])
         assert args.trust == ['app1.exe', 'app2*']
 
-    def test_trust_file(self):
-        args = build_parser().parse_args(['--trust-file', 'trust.txt'])
+    def test_trust_file(self, parser):
+        args = parser.parse_args(['--trust-file', 'trust.txt'])
         assert args.trust_file == 'trust.txt'
 
-    def test_no_default_trust(self):
-        args = build_parser().parse_args(['--no-default-trust'])
+    def test_no_default_trust(self, parser):
+        args = parser.parse_args(['--no-default-trust'])
         assert args.no_default_trust
 
-    def test_all_flag(self):
-        args = build_parser().parse_args(['--all'])
+    def test_all_flag(self, parser):
+        args = parser.parse_args(['--all'])
         assert args.gather_all
 
-    def test_all_flag_short(self):
-        args = build_parser().parse_args(['-a'])
+    def test_all_flag_short(self, parser):
+        args = parser.parse_args(['-a'])
         assert args.gather_all
 
-    def test_defaults_gather_all_false(self):
-        args = build_parser().parse_args([])
+    def test_defaults_gather_all_false(self, parser):
+        args = parser.parse_args([])
         assert not args.gather_all
 
-    def test_combined_flags(self):
-        args = build_parser().parse_args([
+    def test_combined_flags(self, parser):
+        args = parser.parse_args([
             '-n', '-v', '--json', '-tp', 'explorer.exe', '-xp', 'calc.exe'
         ])
         assert args.dry_run
@@ -113,3 +115,33 @@ class TestCLIParsing:
         assert args.json_output
         assert args.trust == ['explorer.exe']
         assert args.exclude_process == ['calc.exe']
+
+
+class TestCLIImportCost:
+    """Importing the CLI must not pull in core or the platform backends."""
+
+    def test_import_cli_does_not_import_core(self):
+        code = (
+            "import sys, wingather.cli; "
+            "heavy = [m for m in ('wingather.core', 'wingather.platforms', "
+            "'psutil', 'win32gui') if m in sys.modules]; "
+            "print(','.join(heavy))"
+        )
+        out = subprocess.run([sys.executable, '-c', code],
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == ''
+
+
+class TestLoadListFile:
+    """Verify exclude/trust list files are parsed correctly."""
+
+    def test_skips_blanks_and_comments(self, tmp_path):
+        from wingather.cli import _load_list_file
+        path = tmp_path / 'list.txt'
+        path.write_text("# comment\n\n  calc.exe  \nnotepad.exe\ncalc.exe\n")
+        assert _load_list_file(str(path), 'exclude') == ['calc.exe', 'notepad.exe']
+
+    def test_missing_file_warns(self, tmp_path, capsys):
+        from wingather.cli import _load_list_file
+        assert _load_list_file(str(tmp_path / 'nope.txt'), 'trust') == []
+        assert 'trust file not found' in capsys.readouterr().err
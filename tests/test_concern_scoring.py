@@ -2,9 +2,13 @@
 
 import pytest
 from wingather.core import (
+    _flag_suspicious,
     _score_to_level,
+    CONCERN_BITS,
     CONCERN_WEIGHTS,
+    _MASK_SCORES,
 )
+from wingather.platforms.base import WindowInfo
 
 
 class TestScoreToLevel:
@@ -78,3 +82,32 @@ class TestConcernWeights:
     def test_all_weights_are_positive(self):
         for key, weight in CONCERN_WEIGHTS.items():
             assert weight > 0, f"Weight for '{key}' should be positive"
+
+
+class TestConcernBits:
+    """Verify the bitmask score table agrees with the weight dict."""
+
+    def test_every_weight_has_a_distinct_bit(self):
+        assert set(CONCERN_BITS) == set(CONCERN_WEIGHTS)
+        bits = list(CONCERN_BITS.values())
+        assert len(set(bits)) == len(bits)
+        for bit in bits:
+            assert bit & (bit - 1) == 0, "each concern must own exactly one bit"
+
+    def test_single_bit_scores_match_weights(self):
+        for key, bit in CONCERN_BITS.items():
+            assert _MASK_SCORES[bit] == CONCERN_WEIGHTS[key]
+
+    def test_combined_mask_is_sum_of_weights(self):
+        mask = CONCERN_BITS['off-screen'] | CONCERN_BITS['dialog']
+        expected = CONCERN_WEIGHTS['off-screen'] + CONCERN_WEIGHTS['dialog']
+        assert _MASK_SCORES[mask] == expected
+
+    def test_flag_suspicious_records_mask(self):
+        wi = WindowInfo(handle=1, title='t', class_name='#32770',
+                        process_name='x.exe', pid=1, x=-32000, y=-32000,
+                        width=400, height=300, state='off-screen',
+                        is_visible=True)
+        _flag_suspicious([wi])
+        assert wi.concern_mask == CONCERN_BITS['off-screen'] | CONCERN_BITS['dialog']
+        assert wi.concern_score == _MASK_SCORES[wi.concern_mask]
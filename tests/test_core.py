@@ -1,19 +1,52 @@
 """Tests for core orchestration logic — simulation, mode gating, and banner."""
 
+import copy
+import json
+import os
+import sys
+import threading
+import types
+from unittest.mock import MagicMock, patch
+
 import pytest
 from wingather.platforms.base import WindowInfo
-from wingather.core import _simulate_window
+from wingather.cli import _print_show_hidden_banner
+from wingather.core import (
+    CASCADE_RADIUS,
+    _apply_filters,
+    _auto_trust_microsoft,
+    _cached_json,
+    _compile_globs,
+    _compute_cascade_offsets,
+    _exclude_by_process,
+    _load_lolbins,
+    _simulate_center_only,
+    _simulate_window,
+    _verify_microsoft_signatures,
+    gather_windows,
+    save_shown_state,
+    undo_show_hidden,
+)
+
+
+# Built once; _make_window() shallow-copies it instead of re-running __init__.
+_PROTO = WindowInfo(
+    handle=12345, title='Test Window', class_name='',
+    process_name='test.exe', pid=1000,
+    x=100, y=100, width=800, height=600,
+    state='normal', is_visible=True,
+)
 
 
 def _make_window(state='normal', suspicious=False, concern_level=0,
                  width=800, height=600, class_name='', x=100, y=100):
     """Create a WindowInfo with sensible defaults for testing."""
-    wi = WindowInfo(
-        handle=12345, title='Test Window', class_name=class_name,
-        process_name='test.exe', pid=1000,
-        x=x, y=y, width=width, height=height,
-        state=state, is_visible=(state != 'hidden'),
-    )
+    wi = copy.copy(_PROTO)
+    wi.class_name = class_name
+    wi.x, wi.y = x, y
+    wi.width, wi.height = width, height
+    wi.state = state
+    wi.is_visible = state != 'hidden'
     wi.suspicious = suspicious
     wi.concern_level = concern_level
     return wi
@@ -119,32 +152,47 @@ class TestSimulateWindowMode:
         assert '+TOPMOST' not in wi.action_taken
 
 
+class TestSimulateCenterOnly:
+    """The dry-run fast path must agree with _simulate_window."""
+
+    @pytest.mark.parametrize('state,width,height', [
+        ('normal', 800, 600),
+        ('maximized', 1920, 1040),
+        ('off-screen', 800, 600),
+        ('normal', 50, 20),
+    ])
+    def test_matches_general_path(self, state, width, height):
+        fast = _make_window(state=state, width=width, height=height)
+        slow = _make_window(state=state, width=width, height=height)
+        _simulate_center_only(fast, 0, 0, 1920, 1080)
+        _simulate_window(slow, 0, 0, 1920, 1080,
+                         show_hidden=False, include_virtual=False)
+        assert fast.action_taken == slow.action_taken
+        assert (fast.target_x, fast.target_y) == (slow.target_x, slow.target_y)
+
+
 class TestCascadeOffsets:
     """Test cascade positioning offset computation."""
 
     def test_single_window_centered(self):
         """Single suspicious window has offset (0, 0) — dead center."""
-        from wingather.core import _compute_cascade_offsets
         offsets = _compute_cascade_offsets(1)
         assert offsets == [(0, 0)]
 
     def test_two_windows_center_and_offset(self):
         """Two windows: one at center, one offset."""
-        from wingather.core import _compute_cascade_offsets, CASCADE_RADIUS
         offsets = _compute_cascade_offsets(2)
         assert offsets[0] == (0, 0)
         assert offsets[1] == (-CASCADE_RADIUS, -CASCADE_RADIUS)
 
     def test_five_windows_all_unique(self):
         """Five windows get five unique positions."""
-        from wingather.core import _compute_cascade_offsets
         offsets = _compute_cascade_offsets(5)
         assert len(offsets) == 5
         assert len(set(offsets)) == 5  # all unique
 
     def test_zero_windows(self):
         """Zero count returns empty list."""
-        from wingather.core import _compute_cascade_offsets
         assert _compute_cascade_offsets(0) == []
 
     def test_cascade_offset_in_simulation(self):
@@ -174,7 +222,6 @@ class TestShowHiddenBanner:
     """Test the educational banner output for --show-hidden."""
 
     def test_banner_suspicious_only_mode(self, capsys):
-        from wingather.cli import _print_show_hidden_banner
         _print_show_hidden_banner(gather_all=False)
         output = capsys.readouterr().out
         assert 'hidden windows are typically system internals' in output.lower()
@@ -182,14 +229,12 @@ class TestShowHiddenBanner:
         assert '--undo' in output
 
     def test_banner_all_mode(self, capsys):
-        from wingather.cli import _print_show_hidden_banner
         _print_show_hidden_banner(gather_all=True)
         output = capsys.readouterr().out
         assert 'hidden windows are typically system internals' in output.lower()
         assert 'showing all hidden windows' in output.lower()
 
     def test_banner_references_docs(self, capsys):
-        from wingather.cli import _print_show_hidden_banner
         _print_show_hidden_banner(gather_all=False)
         output = capsys.readouterr().out
         assert 'hidden-windows.md' in output
@@ -200,8 +245,6 @@ class TestAutoTrustMicrosoft:
 
     def test_microsoft_signed_gets_trusted(self):
         """A suspicious Microsoft-signed non-LOLBin should be auto-trusted."""
-        from wingather.core import _auto_trust_microsoft
-        import os
 
         wi = _make_window(state='normal', suspicious=True, concern_level=3)
         wi.exe_path = 'C:\\Program Files\\Windows Media Player\\wmplayer.exe'
@@ -221,8 +264,6 @@ class TestAutoTrustMicrosoft:
 
     def test_lolbin_stays_suspicious(self):
         """A suspicious Microsoft-signed LOLBin should NOT be auto-trusted."""
-        from wingather.core import _auto_trust_microsoft
-        import os
 
         wi = _make_window(state='hidden', suspicious=True, concern_level=2)
         wi.process_name = 'mshta.exe'
@@ -242,8 +283,6 @@ class TestAutoTrustMicrosoft:
 
     def test_unsigned_stays_suspicious(self):
         """A suspicious window without valid MS signature stays suspicious."""
-        from wingather.core import _auto_trust_microsoft
-        import os
 
         wi = _make_window(state='normal', suspicious=True, concern_level=4)
         wi.exe_path = 'C:\\SomeApp\\shady.exe'
@@ -261,7 +300,6 @@ class TestAutoTrustMicrosoft:
 
     def test_no_exe_path_skipped(self):
         """Windows without exe_path are skipped (no crash)."""
-        from wingather.core import _auto_trust_microsoft
 
         wi = _make_window(state='normal', suspicious=True, concern_level=4)
         wi.exe_path = None
@@ -272,7 +310,6 @@ class TestAutoTrustMicrosoft:
 
     def test_lolbins_load(self):
         """LOLBin list loads and contains expected entries."""
-        from wingather.core import _load_lolbins
         lolbins = _load_lolbins()
         assert 'cmd.exe' in lolbins
         assert 'powershell.exe' in lolbins
@@ -283,33 +320,131 @@ class TestAutoTrustMicrosoft:
         assert 'notepad.exe' not in lolbins
 
 
+class TestCachedJson:
+    """Data files are parsed once and re-read when they change."""
+
+    def test_reparses_only_on_change(self, tmp_path):
+        path = tmp_path / 'data.json'
+        path.write_text('{"patterns": ["a.exe"]}')
+        calls = []
+
+        def build(data):
+            calls.append(data)
+            return frozenset(data['patterns'])
+
+        assert _cached_json(path, build) == {'a.exe'}
+        assert _cached_json(path, build) == {'a.exe'}
+        assert len(calls) == 1
+        path.write_text('{"patterns": ["a.exe", "b.exe"]}')
+        assert _cached_json(path, build) == {'a.exe', 'b.exe'}
+        assert len(calls) == 2
+
+
+class TestSaveShownState:
+    """Undo state is written atomically as compact JSON."""
+
+    def test_round_trip_leaves_no_temp_files(self, isolated_state_dir):
+        wi = _make_window(state='hidden')
+        state_file = save_shown_state([wi])
+        with open(state_file) as f:
+            state = json.load(f)
+        assert state['windows_shown'] == [{
+            'hwnd': wi.handle, 'pid': wi.pid,
+            'process_name': wi.process_name, 'title': wi.title,
+        }]
+        assert [p.name for p in isolated_state_dir.iterdir()] == ['last_shown.json']
+
+
+class TestUndoShowHidden:
+    """Undo validates records against one EnumWindows snapshot."""
+
+    def test_hides_only_live_visible_matching_windows(self, monkeypatch):
+        live = {1: (1000, True), 2: (2000, True), 3: (1000, False)}
+        win32gui = types.SimpleNamespace(
+            EnumWindows=lambda cb, extra: [cb(h, extra) for h in live],
+            IsWindowVisible=lambda h: live[h][1],
+        )
+        win32process = types.SimpleNamespace(
+            GetWindowThreadProcessId=lambda h: (0, live[h][0]),
+        )
+        monkeypatch.setitem(sys.modules, 'win32gui', win32gui)
+        monkeypatch.setitem(sys.modules, 'win32process', win32process)
+
+        # hwnd 1 live; 2 has a new PID; 3 already hidden; 4 gone
+        windows = []
+        for hwnd in (1, 2, 3, 4):
+            wi = _make_window(state='hidden')
+            wi.handle = hwnd
+            windows.append(wi)
+        save_shown_state(windows)
+
+        platform = _StubPlatform([])
+        with patch('wingather.core.get_platform', return_value=platform), \
+             patch.object(platform, 'hide_window', return_value=True) as hide:
+            assert undo_show_hidden() == (1, 3)
+        assert [c.args[0].handle for c in hide.call_args_list] == [1]
+
+    def test_missing_state_file(self):
+        assert undo_show_hidden() == (0, 0)
+
+
+class _StubPlatform:
+    """Plain stand-in for a platform backend; every action succeeds."""
+
+    def __init__(self, windows):
+        self._windows = windows
+
+    def setup(self):
+        return None
+
+    def is_elevated(self):
+        return True
+
+    def get_monitor_work_area(self, monitor_index):
+        return (0, 0, 1920, 1080)
+
+    def get_primary_monitor_work_area(self):
+        return (0, 0, 1920, 1080)
+
+    def enumerate_windows(self, include_hidden=False):
+        return self._windows
+
+    def restore_window(self, window_info):
+        return True
+
+    def show_window(self, window_info):
+        return True
+
+    def center_window(self, *args, **kwargs):
+        return True
+
+    def hide_window(self, window_info):
+        return True
+
+    def move_from_virtual_desktop(self, window_info):
+        return True
+
+    def bring_to_front(self, window_info):
+        return True
+
+
 class TestGatherWindowsModeGating:
     """Test that gather_windows() respects gather_all for normal windows.
 
-    Uses mocked platform to avoid Win32 dependency.
+    Uses a stub platform to avoid Win32 dependency.
     """
 
-    def _make_mock_platform(self, windows):
-        """Create a minimal mock platform returning pre-built windows."""
-        from unittest.mock import MagicMock
-        platform = MagicMock()
-        platform.setup.return_value = None
-        platform.is_elevated.return_value = True
-        platform.get_monitor_work_area.return_value = (0, 0, 1920, 1080)
-        platform.enumerate_windows.return_value = windows
-        platform.restore_window.return_value = True
-        platform.show_window.return_value = True
-        platform.center_window.return_value = True
-        return platform
+    def _make_stub_platform(self, windows):
+        """Create a minimal stub platform returning pre-built windows."""
+        return _StubPlatform(windows)
 
     def test_default_mode_skips_normal(self):
         """Default mode (gather_all=False): normal windows get skip:normal."""
-        from unittest.mock import patch
 
         wi_normal = _make_window(state='normal')
         wi_suspicious = _make_window(state='off-screen', suspicious=True, concern_level=2)
 
-        platform = self._make_mock_platform([wi_normal, wi_suspicious])
+        platform = self._make_stub_platform([wi_normal, wi_suspicious])
 
         with patch('wingather.core.get_platform', return_value=platform), \
              patch('wingather.core._flag_suspicious'):
@@ -326,10 +461,9 @@ class TestGatherWindowsModeGating:
 
     def test_all_mode_processes_everything(self):
         """--all mode (gather_all=True): normal windows get processed."""
-        from unittest.mock import patch
 
         wi_normal = _make_window(state='normal')
-        platform = self._make_mock_platform([wi_normal])
+        platform = self._make_stub_platform([wi_normal])
 
         with patch('wingather.core.get_platform', return_value=platform), \
              patch('wingather.core._flag_suspicious'):
@@ -340,10 +474,9 @@ class TestGatherWindowsModeGating:
 
     def test_filter_overrides_mode(self):
         """--filter implicitly overrides suspicious-only restriction."""
-        from unittest.mock import patch
 
         wi_normal = _make_window(state='normal')
-        platform = self._make_mock_platform([wi_normal])
+        platform = self._make_stub_platform([wi_normal])
 
         with patch('wingather.core.get_platform', return_value=platform), \
              patch('wingather.core._flag_suspicious'), \
@@ -353,3 +486,194 @@ class TestGatherWindowsModeGating:
                                      filter_pattern='*test*')
 
         assert results[0].action_taken == 'would:center'
+
+    def test_all_mode_live_processes_normal_windows_in_order(self):
+        """Live --all run: normal windows are centered serially, in order."""
+        windows = [_make_window(state=s) for s in
+                   ('normal', 'minimized', 'hidden', 'cloaked', 'normal')]
+        for hwnd, wi in enumerate(windows, 1):
+            wi.handle = hwnd
+        platform = self._make_stub_platform(windows)
+        caller = threading.get_ident()
+        centered = []
+
+        def center_window(wi, *args, **kwargs):
+            centered.append((wi.handle, threading.get_ident()))
+            return True
+
+        platform.center_window = center_window
+
+        with patch('wingather.core.get_platform', return_value=platform), \
+             patch('wingather.core._flag_suspicious'), \
+             patch('wingather.core.save_shown_state') as save:
+            results = gather_windows(gather_all=True, show_hidden=True,
+                                     include_virtual=True)
+
+        assert [w.action_taken for w in results] == [
+            'centered', 'restored+centered', 'shown+centered',
+            'pulled-from-desktop+centered', 'centered']
+        assert centered == [(h, caller) for h in (1, 2, 3, 4, 5)]
+        save.assert_called_once_with([windows[2]])
+
+
+class TestPatternFilters:
+    """Test process exclusion and title/process filters (fnmatch semantics)."""
+
+    def _named(self, process_name, title='Test Window'):
+        wi = _make_window()
+        wi.process_name = process_name
+        wi.title = title
+        return wi
+
+    def test_exclude_by_process_multiple_patterns(self):
+        windows = [self._named('notepad.exe'), self._named('Chrome.exe'),
+                   self._named('calc.exe')]
+        kept = _exclude_by_process(windows, ['notepad.exe', 'chrome*'])
+        assert [w.process_name for w in kept] == ['calc.exe']
+
+    def test_exclude_by_process_empty_list_keeps_all(self):
+        windows = [self._named('notepad.exe')]
+        assert _exclude_by_process(windows, []) == windows
+
+    def test_apply_filters_include_and_exclude(self):
+        windows = [self._named('chrome.exe', 'Inbox'),
+                   self._named('chrome.exe', 'DevTools - debug'),
+                   self._named('notepad.exe', 'notes')]
+        kept = _apply_filters(windows, '*CHROME*', '*debug*')
+        assert [w.title for w in kept] == ['Inbox']
+
+    def test_apply_filters_single_side(self):
+        windows = [self._named('chrome.exe', 'Inbox'),
+                   self._named('notepad.exe', 'notes')]
+        assert [w.title for w in _apply_filters(windows, '*notes*', None)] == ['notes']
+        assert [w.title for w in _apply_filters(windows, None, '*notes*')] == ['Inbox']
+        assert len(_apply_filters(windows, None, None)) == 2
+
+    def test_compile_globs_none_for_no_patterns(self):
+        assert _compile_globs([]) is None
+        assert _compile_globs(None) is None
+
+
+class TestSignatureMemo:
+    """Repeat verification of an unchanged file skips PowerShell."""
+
+    def _run(self, path, roots=(), wintrust=None):
+        """Verify one path with PowerShell stubbed.
+
+        By default there is no OS-roots prefilter and no native wintrust, so
+        every cache miss reaches the stubbed PowerShell run.
+        """
+        out = MagicMock(stdout=f"{path}|Valid|True|CN=Microsoft Windows\n")
+        with patch('wingather.core._os_roots', return_value=roots), \
+             patch('wingather.core._load_wintrust', return_value=wintrust), \
+             patch('wingather.core.subprocess.run', return_value=out) as run:
+            result = _verify_microsoft_signatures([path])
+        return result, run.call_count
+
+    def test_unchanged_file_served_from_memo(self, tmp_path):
+        exe = tmp_path / 'memo_a.exe'
+        exe.write_bytes(b'MZ')
+        first, calls = self._run(str(exe))
+        assert calls == 1
+        second, calls = self._run(str(exe))
+        assert calls == 0
+        assert second == first
+
+    def test_memo_persists_across_runs(self, tmp_path, monkeypatch):
+        exe = tmp_path / 'memo_c.exe'
+        exe.write_bytes(b'MZ')
+        first, _ = self._run(str(exe))
+        # Simulate a fresh process: drop the in-memory memo
+        monkeypatch.setattr('wingather.core._sig_memo', None)
+        second, calls = self._run(str(exe))
+        assert calls == 0
+        assert second == first
+
+    def test_modified_file_reverified(self, tmp_path):
+        exe = tmp_path / 'memo_b.exe'
+        exe.write_bytes(b'MZ')
+        self._run(str(exe))
+        exe.write_bytes(b'MZ-changed')
+        _, calls = self._run(str(exe))
+        assert calls == 1
+
+    def test_native_results_skip_powershell(self, tmp_path):
+        exe = tmp_path / 'native.exe'
+        exe.write_bytes(b'MZ')
+        native = {'valid': True, 'is_os_binary': True, 'signer': 'CN=Microsoft Windows'}
+        with patch('wingather.core._verify_signature_native', return_value=native):
+            result, calls = self._run(str(exe), wintrust=object())
+        assert calls == 0
+        assert list(result.values()) == [native]
+
+    def test_native_failure_falls_back_to_powershell(self, tmp_path):
+        exe = tmp_path / 'fallback.exe'
+        exe.write_bytes(b'MZ')
+        with patch('wingather.core._verify_signature_native', return_value=None):
+            result, calls = self._run(str(exe), wintrust=object())
+        assert calls == 1
+        assert list(result.values())[0]['valid']
+
+    def test_powershell_fallback_chunks_long_lists(self, tmp_path):
+        paths = []
+        for i in range(10):
+            exe = tmp_path / f'chunk{i}.exe'
+            exe.write_bytes(b'MZ')
+            paths.append(str(exe))
+
+        def fake_run(cmd, **kwargs):
+            script = cmd[-1]
+            lines = [f"{p}|Valid|True|CN=x" for p in paths if f"'{p}'" in script]
+            return MagicMock(stdout='\n'.join(lines))
+
+        with patch('wingather.core.POWERSHELL_CHUNK_SIZE', 4), \
+             patch('wingather.core._os_roots', return_value=()), \
+             patch('wingather.core._load_wintrust', return_value=None), \
+             patch('wingather.core.subprocess.run', side_effect=fake_run) as run:
+            result = _verify_microsoft_signatures(paths)
+        assert run.call_count == 3
+        assert len(result) == 10
+
+    def test_paths_outside_os_roots_not_checked(self, tmp_path):
+        os_root = tmp_path / 'Windows'
+        os_root.mkdir()
+        outside = tmp_path / 'Downloads' / 'tool.exe'
+        outside.parent.mkdir()
+        outside.write_bytes(b'MZ')
+        roots = (os.path.join(os.path.normcase(str(os_root)), ''),)
+        result, calls = self._run(str(outside), roots=roots)
+        assert calls == 0
+        assert list(result.values()) == [
+            {'valid': False, 'is_os_binary': False, 'signer': ''}]
+
+    def test_persisted_entry_outside_os_roots_ignored(self, tmp_path,
+                                                      isolated_state_dir):
+        os_root = tmp_path / 'Windows'
+        os_root.mkdir()
+        planted = tmp_path / 'AppData' / 'evil.exe'
+        planted.parent.mkdir()
+        planted.write_bytes(b'MZ')
+        st = planted.stat()
+        isolated_state_dir.mkdir()
+        (isolated_state_dir / 'sig_cache.json').write_text(json.dumps({
+            'version': 1,
+            'entries': {os.path.normcase(os.path.normpath(str(planted))): {
+                'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                'valid': True, 'is_os_binary': True,
+                'signer': 'CN=Microsoft Windows', 'used': 0,
+            }},
+        }))
+        roots = (os.path.join(os.path.normcase(str(os_root)), ''),)
+        result, calls = self._run(str(planted), roots=roots)
+        assert calls == 0
+        assert list(result.values()) == [
+            {'valid': False, 'is_os_binary': False, 'signer': ''}]
+
+    def test_disk_cache_capped(self, tmp_path, monkeypatch, isolated_state_dir):
+        monkeypatch.setattr('wingather.core.SIG_CACHE_MAX_ENTRIES', 1)
+        for name in ('cap_a.exe', 'cap_b.exe'):
+            exe = tmp_path / name
+            exe.write_bytes(b'MZ')
+            self._run(str(exe))
+        with open(isolated_state_dir / 'sig_cache.json') as f:
+            assert len(json.load(f)['entries']) == 1
@@ -1,7 +1,12 @@
 """Tests for table rendering utilities."""
 
+import json
+
 import pytest
-from wingather.cli import _render_wrapped, _safe_str
+from wingather.cli import (
+    _json_entry, _make_row_formatter, _print_json, _render_wrapped, _safe_str,
+)
+from wingather.platforms.base import WindowInfo
 
 
 class TestSafeStr:
@@ -54,3 +59,58 @@ class TestRenderWrapped:
         assert lines[0].index("A") == 0
         assert lines[0].index("B") == 5
         assert lines[0].index("C") == 10
+
+
+class TestRowFormatter:
+    """Verify the specialized row formatter matches _render_wrapped."""
+
+    STARTS = (0, 5, 12, 20)
+
+    def _expected(self, cells):
+        return _render_wrapped(list(zip(self.STARTS, cells)))
+
+    def test_fitting_row_matches(self):
+        cells = ["[!1]", "123", "normal", "title here"]
+        assert _make_row_formatter(self.STARTS)(cells) == self._expected(cells)
+
+    def test_overflowing_row_matches(self):
+        cells = ["[!1]", "a-much-too-long-value", "normal", "title"]
+        result = _make_row_formatter(self.STARTS)(cells)
+        assert result == self._expected(cells)
+        assert len(result.split("\n")) == 2
+
+    def test_blank_row_is_empty(self):
+        cells = ["    ", "", "", ""]
+        assert _make_row_formatter(self.STARTS)(cells) == ""
+
+    def test_formatter_is_cached_per_layout(self):
+        assert _make_row_formatter(self.STARTS) is _make_row_formatter(self.STARTS)
+
+
+class TestPrintJson:
+    """Streamed JSON must match a one-shot json.dumps(indent=2)."""
+
+    def _window(self, handle, **attrs):
+        wi = WindowInfo(handle=handle, title='Title "quoted"\nline',
+                        class_name='C', process_name='p.exe', pid=7,
+                        x=0, y=0, width=640, height=480,
+                        state='normal', is_visible=True)
+        for name, value in attrs.items():
+            setattr(wi, name, value)
+        return wi
+
+    def test_matches_dumps(self, capsys):
+        results = [
+            self._window(1),
+            self._window(2, suspicious=True, concern_level=2,
+                         suspicious_reason='off-screen', target_x=5, target_y=6),
+            self._window(3, trusted=True, trust_source='default',
+                         trust_verified='microsoft'),
+        ]
+        _print_json(results, 'dry-run')
+        expected = json.dumps([_json_entry(w) for w in results], indent=2)
+        assert capsys.readouterr().out == expected + '\n'
+
+    def test_empty(self, capsys):
+        _print_json([], 'list')
+        assert capsys.readouterr().out == '[]\n'
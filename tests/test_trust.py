@@ -1,8 +1,12 @@
 """Tests for trust matching, path verification, and default trust loading."""
 
 import os
+from unittest.mock import patch
+
 import pytest
-from wingather.core import _verify_exe_path, _load_default_trust, _check_trust
+from wingather.core import (
+    _verify_exe_path, _load_default_trust, _check_trust, _flag_suspicious,
+)
 from wingather.platforms.base import WindowInfo
 
 
@@ -76,6 +80,11 @@ class TestLoadDefaultTrust:
         patterns = [e['pattern'] for e in entries]
         assert 'explorer.exe' in patterns
 
+    def test_returns_fresh_list(self):
+        first = _load_default_trust()
+        first.clear()
+        assert len(_load_default_trust()) > 0
+
     def test_microsoft_entries_have_verify(self):
         """Entries with expected_paths should also have verify='microsoft'."""
         entries = _load_default_trust()
@@ -116,6 +125,30 @@ class TestCheckTrust:
         result = _check_trust(wi, entries, {})
         assert result[0] == 'trusted'
 
+    def test_first_matching_entry_wins(self):
+        wi = self._make_window("chrome_helper.exe")
+        entries = [
+            {'pattern': 'firefox.exe', 'source': 'default'},
+            {'pattern': 'chrome*', 'source': 'default'},
+            {'pattern': '*helper.exe', 'source': 'user'},
+        ]
+        result = _check_trust(wi, entries, {})
+        assert result == ('trusted', entries[1])
+
+    def test_literal_and_wildcard_order_respected(self):
+        wi = self._make_window("Chrome.exe")
+        literal_first = [
+            {'pattern': 'chrome.exe', 'source': 'user'},
+            {'pattern': 'chrome*', 'source': 'default'},
+        ]
+        assert _check_trust(wi, literal_first, {}) == ('trusted', literal_first[0])
+        wildcard_first = list(reversed(literal_first))
+        assert _check_trust(wi, wildcard_first, {}) == ('trusted', wildcard_first[0])
+
+    def test_empty_entries_returns_none(self):
+        wi = self._make_window("myapp.exe")
+        assert _check_trust(wi, [], {}) is None
+
     def test_case_insensitive_match(self):
         wi = self._make_window("Explorer.EXE")
         entries = [{'pattern': 'explorer.exe', 'source': 'default'}]
@@ -168,3 +201,22 @@ class TestCheckTrust:
         entries = [{'pattern': 'myapp.exe', 'source': 'user'}]
         result = _check_trust(wi, entries, {})
         assert result[0] == 'trusted'
+
+
+class TestTrustMemo:
+    """_flag_suspicious checks trust once per (process_name, exe_path)."""
+
+    def test_shared_process_checked_once(self):
+        windows = [
+            WindowInfo(handle=h, title="t", class_name="C",
+                       process_name="app.exe", pid=1000,
+                       x=0, y=0, width=800, height=600,
+                       state='normal', is_visible=True)
+            for h in range(5)
+        ]
+        for wi in windows:
+            wi.exe_path = r"C:\app\app.exe"
+        entries = [{'pattern': 'app.exe', 'source': 'user'}]
+        with patch('wingather.core._check_trust', wraps=_check_trust) as ct:
+            _flag_suspicious(windows, trust_entries=entries)
+        assert ct.call_count == 1
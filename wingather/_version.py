@@ -19,6 +19,10 @@ Version levels:
                  Example: BETA 0.5.1-alpha = project is beta, 0.5.x features in progress.
 """
 
+import re
+from collections import namedtuple
+from functools import lru_cache
+
 # Version components - edit these for version bumps
 MAJOR = 0
 MINOR = 2
@@ -32,11 +36,26 @@ __version__ = "0.2.3-alpha_main_22-20260213-55b6e609"
 __app_name__ = "wingather"
 
 
+# MAJOR.MINOR.PATCH[-PHASE][_BRANCH[_BUILD-YYYYMMDD-COMMITHASH]]
+_VERSION_RE = re.compile(
+    r'^(?P<base>[^_]*)'
+    r'(?:_(?P<branch>.*?)(?:_(?P<build>\d+)-(?P<date>\d{8})-(?P<commit>\w+))?)?$')
+
+_VersionParts = namedtuple('_VersionParts', 'base branch build date commit')
+
+
+@lru_cache(maxsize=None)
+def _parse_version():
+    """Split __version__ into its components (missing parts are None)."""
+    return _VersionParts(**_VERSION_RE.match(__version__).groupdict())
+
+
 def get_version():
     """Return the full version string including branch and build info."""
     return __version__
 
 
+@lru_cache(maxsize=None)
 def get_display_version():
     """Return a human-friendly version string with project phase.
 
@@ -48,17 +67,20 @@ def get_display_version():
     return base
 
 
+@lru_cache(maxsize=None)
 def get_base_version():
     """Return the semantic version string (MAJOR.MINOR.PATCH[-PHASE])."""
-    if "_" in __version__:
+    parts = _parse_version()
+    if parts.branch is not None:
         # Phase is already embedded in __version__ (e.g., 0.1.2-alpha_main_...)
-        return __version__.split("_")[0]
+        return parts.base
     base = f"{MAJOR}.{MINOR}.{PATCH}"
     if PHASE:
         base = f"{base}-{PHASE}"
     return base
 
 
+@lru_cache(maxsize=None)
 def get_pip_version():
     """
     Return PEP 440 compliant version for pip/setuptools.
@@ -75,18 +97,10 @@ def get_pip_version():
     if PHASE:
         base += phase_map.get(PHASE, PHASE)
 
-    if "_" not in __version__:
-        return base
-
-    parts = __version__.split("_")
-    branch = parts[1] if len(parts) > 1 else "unknown"
-
-    if branch == "main":
+    parts = _parse_version()
+    if parts.branch is None or parts.branch == "main":
         return base
-    else:
-        build_info = "_".join(parts[2:]) if len(parts) > 2 else ""
-        build_num = build_info.split("-")[0] if "-" in build_info else "0"
-        return f"{base}.dev{build_num}"
+    return f"{base}.dev{parts.build or '0'}"
 
 
 # For convenience in imports
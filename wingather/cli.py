@@ -1,15 +1,18 @@
 """Command-line interface for wingather."""
 
 import argparse
+import functools
 import json
 import logging
+import operator
 import sys
 
 from wingather import __version__, __app_name__, DISPLAY_VERSION
-from wingather.core import gather_windows, undo_show_hidden
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser():
+    """Build the argument parser (cached; callers share one instance)."""
     parser = argparse.ArgumentParser(
         prog=__app_name__,
         description="Find suspicious windows and bring them to your attention.",
@@ -128,6 +131,10 @@ def main(argv=None):
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    # Deferred until after parsing so --help, --version and argument errors
+    # don't pay for importing core and the platform backend.
+    from wingather.core import gather_windows, undo_show_hidden
+
     # Configure logging
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
@@ -152,28 +159,12 @@ def main(argv=None):
     # Build process exclusion list
     exclude_processes = list(args.exclude_process)
     if args.exclude_file:
-        try:
-            with open(args.exclude_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        exclude_processes.append(line)
-        except FileNotFoundError:
-            print(f"Warning: exclude file not found: {args.exclude_file}",
-                  file=sys.stderr)
+        exclude_processes += _load_list_file(args.exclude_file, 'exclude')
 
     # Build trusted process list (whitelist from suspicious flagging)
     trusted_processes = list(args.trust)
     if args.trust_file:
-        try:
-            with open(args.trust_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        trusted_processes.append(line)
-        except FileNotFoundError:
-            print(f"Warning: trust file not found: {args.trust_file}",
-                  file=sys.stderr)
+        trusted_processes += _load_list_file(args.trust_file, 'trust')
 
     try:
         results = gather_windows(
@@ -207,48 +198,94 @@ def main(argv=None):
 
 def _print_show_hidden_banner(gather_all):
     """Print educational banner when --show-hidden is used."""
-    print("\n  NOTE: Hidden windows are typically system internals (GDI+ surfaces,")
-    print("  DDE handlers, .NET event pumps) with no user interface. They are")
-    print("  hidden because they serve background functions. Use --undo to reverse.")
-    print("  See docs/hidden-windows.md for details.")
+    lines = [
+        "",
+        "  NOTE: Hidden windows are typically system internals (GDI+ surfaces,",
+        "  DDE handlers, .NET event pumps) with no user interface. They are",
+        "  hidden because they serve background functions. Use --undo to reverse.",
+        "  See docs/hidden-windows.md for details.",
+    ]
     if not gather_all:
-        print("  Mode: suspicious hidden windows only. Use --all to reveal all.\n")
+        lines.append("  Mode: suspicious hidden windows only. Use --all to reveal all.\n")
     else:
-        print("  Mode: showing ALL hidden windows.\n")
+        lines.append("  Mode: showing ALL hidden windows.\n")
+    # One write instead of a print() per line
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _load_list_file(path, kind):
+    """Read a one-pattern-per-line file, skipping blanks and # comments.
+
+    Duplicates are dropped (first occurrence kept, order preserved). A missing
+    file prints a warning naming the kind of list and yields no entries.
+    """
+    try:
+        with open(path, 'r') as f:
+            text = f.read()
+    except FileNotFoundError:
+        print(f"Warning: {kind} file not found: {path}", file=sys.stderr)
+        return []
+    return list(dict.fromkeys(
+        s for s in map(str.strip, text.splitlines())
+        if s and not s.startswith('#')))
 
 
 def _print_json(results, mode):
-    data = []
+    # Streamed one entry at a time; output matches json.dumps(list, indent=2)
+    if not results:
+        print('[]')
+        return
+    write = sys.stdout.write
+    sep = '[\n  '
     for wi in results:
-        entry = {
-            'handle': wi.handle,
-            'title': wi.title,
-            'class': wi.class_name,
-            'process': wi.process_name,
-            'pid': wi.pid,
-            'state': wi.state,
-            'action': wi.action_taken,
-            'current_position': {'x': wi.x, 'y': wi.y, 'w': wi.width, 'h': wi.height},
-        }
-        if wi.target_x is not None:
-            entry['target_position'] = {'x': wi.target_x, 'y': wi.target_y}
-        if wi.suspicious:
-            entry['concern_level'] = wi.concern_level
-            entry['concern_score'] = wi.concern_score
-            entry['concern_reason'] = wi.suspicious_reason
-        if wi.trusted:
-            entry['trusted'] = True
-            entry['trust_source'] = wi.trust_source
-            if wi.trust_verified:
-                entry['trust_verified'] = wi.trust_verified
-            entry['would_concern_level'] = wi.would_concern_level
-            entry['would_concern_reason'] = wi.would_flag_reason
-        data.append(entry)
-    print(json.dumps(data, indent=2))
+        write(sep)
+        write(json.dumps(_json_entry(wi), indent=2).replace('\n', '\n  '))
+        sep = ',\n  '
+    write('\n]\n')
+
+
+# Per-window fields read by the table and JSON row loops, fetched in one call
+_row_fields = operator.attrgetter(
+    'handle', 'title', 'process_name', 'pid', 'state', 'suspicious',
+    'concern_level', 'action_taken', 'x', 'y', 'width', 'height',
+    'target_x', 'target_y')
+
+
+def _json_entry(wi):
+    """Build the JSON-serializable dict for one window."""
+    (handle, title, proc, pid, state, _, _, action,
+     x, y, width, height, target_x, target_y) = _row_fields(wi)
+    entry = {
+        'handle': handle,
+        'title': title,
+        'class': wi.class_name,
+        'process': proc,
+        'pid': pid,
+        'state': state,
+        'action': action,
+        'current_position': {'x': x, 'y': y, 'w': width, 'h': height},
+    }
+    if target_x is not None:
+        entry['target_position'] = {'x': target_x, 'y': target_y}
+    if wi.suspicious:
+        entry['concern_level'] = wi.concern_level
+        entry['concern_score'] = wi.concern_score
+        entry['concern_reason'] = wi.suspicious_reason
+    if wi.trusted:
+        entry['trusted'] = True
+        entry['trust_source'] = wi.trust_source
+        if wi.trust_verified:
+            entry['trust_verified'] = wi.trust_verified
+        entry['would_concern_level'] = wi.would_concern_level
+        entry['would_concern_reason'] = wi.would_flag_reason
+    return entry
 
 
 def _safe_str(s):
     """Encode string safely for console output, replacing unencodable chars."""
+    if s.isascii():
+        # Every console encoding is an ASCII superset; skip the trial encode
+        return s
     try:
         s.encode(sys.stdout.encoding or 'utf-8')
         return s
@@ -277,21 +314,45 @@ def _render_wrapped(parts):
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=8)
+def _make_row_formatter(starts):
+    """Return a row renderer specialized for a tuple of column start positions.
+
+    The renderer takes the row's cells (one per column) and produces the same
+    text as _render_wrapped(). When every cell fits before the next column
+    starts, the whole row is one precomputed str.format call. Rows with an
+    overflowing cell fall back to _render_wrapped() for wrapping.
+    """
+    widths = tuple(b - a for a, b in zip(starts, starts[1:]))
+    fmt = ''.join(f'{{:<{w}}}' for w in widths) + '{}'
+
+    def render(cells):
+        if all(map(operator.le, map(len, cells), widths)):
+            return fmt.format(*cells).rstrip()
+        return _render_wrapped(list(zip(starts, cells)))
+
+    return render
+
+
 def _print_table(results, mode):
     if not results:
         print("No windows found.")
         return
 
+    # Lines are collected and written once; a table is hundreds of lines
+    out = []
+    emit = out.append
+
     show_target = mode in ('dry-run', 'live')
 
     # Header
     labels = {'list': 'DISCOVERED', 'dry-run': 'DRY RUN', 'live': 'GATHERED'}
     header = labels.get(mode, 'WINDOWS')
-    print(f"\n  {header}: {len(results)} window(s)")
+    emit(f"\n  {header}: {len(results)} window(s)")
     if mode == 'dry-run':
-        print("  (no windows will be moved)\n")
+        emit("  (no windows will be moved)\n")
     else:
-        print()
+        emit("")
 
     # Column definitions: (label, width, gap_after, right_align)
     # Empty label = blank in header/separator (used for the [!N] flag prefix)
@@ -323,68 +384,71 @@ def _print_table(results, mode):
         starts.append(pos)
         pos += width + gap
 
+    # The column layout is fixed for the whole table
+    render_row = _make_row_formatter(tuple(starts))
+
     # Print header and separator
-    hdr_parts = []
-    sep_parts = []
-    for i, (label, width, _, right) in enumerate(columns):
+    hdr_cells = []
+    sep_cells = []
+    for label, width, _, right in columns:
         if not label:
-            hdr_parts.append((starts[i], " " * width))
-            sep_parts.append((starts[i], " " * width))
+            hdr_cells.append(" " * width)
+            sep_cells.append(" " * width)
         else:
             fmt = f"{label:>{width}}" if right else f"{label:<{width}}"
-            hdr_parts.append((starts[i], fmt))
-            sep_parts.append((starts[i], "-" * width))
-    print(_render_wrapped(hdr_parts))
-    print(_render_wrapped(sep_parts))
-
-    # Print rows
+            hdr_cells.append(fmt)
+            sep_cells.append("-" * width)
+    emit(render_row(hdr_cells))
+    emit(render_row(sep_cells))
+
+    # Print rows, tallying the summary counts in the same pass
+    actions = {}
+    by_level = {}
+    trusted = []
     for wi in results:
-        action = wi.action_taken or ('--' if mode == 'list' else 'skipped')
-        title = _safe_str(wi.title[:50]) if wi.title else '<untitled>'
-        proc = _safe_str(wi.process_name[:20]) if wi.process_name else '<unknown>'
-        flag = f'[!{wi.concern_level}]' if wi.suspicious else '    '
+        (handle, title, proc, pid, state, suspicious, level, action,
+         x, y, width, height, target_x, target_y) = _row_fields(wi)
+        action = action or ('--' if mode == 'list' else 'skipped')
+        actions[action] = actions.get(action, 0) + 1
+        if suspicious:
+            by_level[level] = by_level.get(level, 0) + 1
+        if wi.trusted:
+            trusted.append(wi)
+        title = _safe_str(title[:50]) if title else '<untitled>'
+        proc = _safe_str(proc[:20]) if proc else '<unknown>'
+        flag = f'[!{level}]' if suspicious else '    '
 
-        cells = [flag, f"{wi.handle:>10}", f"{wi.pid:>7}", wi.state]
+        cells = [flag, f"{handle:>10}", f"{pid:>7}", state]
         if show_target:
-            cur_pos = f"({wi.x},{wi.y}) {wi.width}x{wi.height}"
-            tgt_pos = f"-> ({wi.target_x},{wi.target_y})" if wi.target_x is not None else ""
+            cur_pos = f"({x},{y}) {width}x{height}"
+            tgt_pos = f"-> ({target_x},{target_y})" if target_x is not None else ""
             cells += [action, cur_pos, tgt_pos]
         else:
             cells += [action]
         cells += [proc, title]
 
-        parts = list(zip(starts, cells))
-        print(_render_wrapped(parts))
+        emit(render_row(cells))
 
-        if wi.suspicious:
+        if suspicious:
             label = {1: 'ALERT', 2: 'ALERT', 3: 'CONCERN',
-                     4: 'NOTE', 5: 'NOTE'}.get(wi.concern_level, 'NOTE')
-            print(f"      ** {label} {wi.concern_level}: {wi.suspicious_reason}")
+                     4: 'NOTE', 5: 'NOTE'}.get(level, 'NOTE')
+            emit(f"      ** {label} {level}: {wi.suspicious_reason}")
 
-    print()
+    emit("")
 
     # Summary
-    flagged = [w for w in results if w.suspicious]
     if mode != 'list':
-        actions = {}
-        for wi in results:
-            a = wi.action_taken or 'skipped'
-            actions[a] = actions.get(a, 0) + 1
         summary = ', '.join(f"{v} {k}" for k, v in sorted(actions.items()))
-        print(f"  Summary: {summary}")
-    if flagged:
-        by_level = {}
-        for w in flagged:
-            by_level.setdefault(w.concern_level, 0)
-            by_level[w.concern_level] += 1
+        emit(f"  Summary: {summary}")
+    if by_level:
+        flagged_count = sum(by_level.values())
         parts = [f"{count}x level {lvl}" for lvl, count in sorted(by_level.items())]
-        print(f"  Flagged: {len(flagged)} window(s) ({', '.join(parts)})")
-        print(f"  Scale: 1=highest concern, 5=informational.")
+        emit(f"  Flagged: {flagged_count} window(s) ({', '.join(parts)})")
+        emit(f"  Scale: 1=highest concern, 5=informational.")
 
     # Show trusted (suppressed) windows so users know what was skipped
-    trusted = [w for w in results if w.trusted]
     if trusted:
-        print(f"\n  Trusted (flagging suppressed): {len(trusted)} window(s)")
+        emit(f"\n  Trusted (flagging suppressed): {len(trusted)} window(s)")
         for w in trusted:
             level_label = {1: 'ALERT', 2: 'ALERT', 3: 'CONCERN',
                            4: 'NOTE', 5: 'NOTE'}.get(w.would_concern_level, 'NOTE')
@@ -392,7 +456,8 @@ def _print_table(results, mode):
             verify_labels = {'microsoft': 'MS-signed'}
             verified = verify_labels.get(w.trust_verified, w.trust_verified)
             badge = f"{w.trust_source}, {verified}" if w.trust_verified else w.trust_source
-            print(f"    {proc:<24} would be [!{w.would_concern_level}] "
-                  f"{level_label}: {w.would_flag_reason}  [{badge}]")
-        print(f"  Use --no-default-trust to flag these windows too.")
-    print()
+            emit(f"    {proc:<24} would be [!{w.would_concern_level}] "
+                 f"{level_label}: {w.would_flag_reason}  [{badge}]")
+        emit(f"  Use --no-default-trust to flag these windows too.")
+    emit("")
+    sys.stdout.write("\n".join(out) + "\n")
@@ -1,15 +1,24 @@
 """Core orchestration logic for wingather (platform-agnostic)."""
 
+import concurrent.futures
+import ctypes
 import datetime
 import fnmatch
+import functools
 import json
 import logging
+import math
+import operator
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 from wingather.platforms import get_platform
+from wingather.platforms.base import WindowInfo
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +34,11 @@ DIALOG_CLASSES = {
     '#32770',   # Standard Windows dialog (MessageBox, ShellExecute errors, etc.)
 }
 
+# States exempt from the 'shrunk' indicator (not on screen at their real size)
+_SHRINK_EXEMPT_STATES = frozenset(('minimized', 'hidden'))
+# States where a partially-off-screen position is meaningful
+_EDGE_CHECK_STATES = frozenset(('normal', 'cloaked'))
+
 # Concern scoring: each indicator adds points. Total maps to a DEFCON-style
 # level (1 = highest concern, 5 = lowest/informational).
 #
@@ -39,6 +53,15 @@ CONCERN_WEIGHTS = {
     'trust-verification-failed': 5,  # masquerading as a trusted process name
 }
 
+# Each indicator owns one bit; _flag_suspicious ORs them into a mask and looks
+# the total score up in _MASK_SCORES instead of summing weights per window.
+# (An indicator fires at most once per window, so mask and sum agree.)
+CONCERN_BITS = {key: 1 << i for i, key in enumerate(CONCERN_WEIGHTS)}
+_MASK_SCORES = tuple(
+    sum(weight for key, weight in CONCERN_WEIGHTS.items() if mask & CONCERN_BITS[key])
+    for mask in range(1 << len(CONCERN_WEIGHTS))
+)
+
 # Cascade positioning: offset suspicious windows around screen center so
 # multiple flagged windows are all visible simultaneously.
 # Index 0 = dead center (reserved for highest priority), then outward.
@@ -56,6 +79,16 @@ _CASCADE_DIRECTIONS = [
     (0, 1),       # bottom
 ]
 
+# Unit vectors for the 8 positions of each outer ring (45 degree steps),
+# so ring offsets need only a multiply per window.
+_RING_UNIT_VECTORS = tuple(
+    (math.cos(k * (math.pi / 4)), math.sin(k * (math.pi / 4))) for k in range(8)
+)
+
+# Offsets for the fixed positions (0-8)
+_FIXED_CASCADE = tuple((dx * CASCADE_RADIUS, dy * CASCADE_RADIUS)
+                       for dx, dy in _CASCADE_DIRECTIONS)
+
 
 def _compute_cascade_offsets(count):
     """Compute (offset_x, offset_y) for each position in a cascade.
@@ -66,20 +99,21 @@ def _compute_cascade_offsets(count):
     """
     if count <= 0:
         return []
-    offsets = []
-    for i in range(count):
-        if i < len(_CASCADE_DIRECTIONS):
-            dx, dy = _CASCADE_DIRECTIONS[i]
-            offsets.append((dx * CASCADE_RADIUS, dy * CASCADE_RADIUS))
-        else:
-            import math
-            ring = (i - len(_CASCADE_DIRECTIONS)) // 8 + 2
-            pos_in_ring = (i - len(_CASCADE_DIRECTIONS)) % 8
-            angle = pos_in_ring * (math.pi / 4)
-            radius = CASCADE_RADIUS * ring
-            offsets.append((int(radius * math.cos(angle)),
-                           int(radius * math.sin(angle))))
-    return offsets
+    return list(_cascade_offsets(count))
+
+
+@functools.lru_cache(maxsize=32)
+def _cascade_offsets(count):
+    """Cached tuple form of _compute_cascade_offsets (count > 0)."""
+    if count <= len(_FIXED_CASCADE):
+        return _FIXED_CASCADE[:count]
+    offsets = list(_FIXED_CASCADE)
+    for i in range(len(_FIXED_CASCADE), count):
+        ring, pos_in_ring = divmod(i - len(_FIXED_CASCADE), 8)
+        ux, uy = _RING_UNIT_VECTORS[pos_in_ring]
+        radius = CASCADE_RADIUS * (ring + 2)
+        offsets.append((int(radius * ux), int(radius * uy)))
+    return tuple(offsets)
 
 
 def gather_windows(list_only=False, dry_run=False, show_hidden=False,
@@ -148,9 +182,7 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     trust_entries = []
     if not no_default_trust:
         defaults = _load_default_trust()
-        for entry in defaults:
-            entry['source'] = 'default'
-            trust_entries.append(entry)
+        trust_entries.extend(dict(entry, source='default') for entry in defaults)
         if defaults:
             logger.debug(f"Loaded {len(defaults)} default trust entry/entries")
     if trusted_processes:
@@ -160,14 +192,13 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     # For default entries that require verification, batch-verify signatures
     # up front so we only call PowerShell once.
     sig_cache = {}
-    if trust_entries:
+    verify_re = _compile_globs(
+        [e['pattern'] for e in trust_entries if e.get('verify')])
+    if verify_re:
         verify_paths = set()
         for wi in windows:
-            if wi.exe_path:
-                for entry in trust_entries:
-                    if entry.get('verify') and fnmatch.fnmatch(
-                            wi.process_name.lower(), entry['pattern'].lower()):
-                        verify_paths.add(wi.exe_path)
+            if wi.exe_path and verify_re.match(wi.process_name.lower()):
+                verify_paths.add(wi.exe_path)
         if verify_paths:
             logger.debug(f"Verifying signatures for {len(verify_paths)} executable(s)")
             sig_cache = _verify_microsoft_signatures(list(verify_paths))
@@ -179,13 +210,14 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     # Auto-trust: check if suspicious windows are Microsoft-signed OS binaries.
     # LOLBins (cmd, powershell, mshta, etc.) are excluded from auto-trust.
     if not no_default_trust:
-        suspicious_paths = set()
+        # Only verify paths not already in the cache (one pass, deduped by key)
+        pending = {}
         for wi in windows:
             if wi.suspicious and wi.exe_path:
-                suspicious_paths.add(wi.exe_path)
-        # Only verify paths not already in the cache
-        new_paths = [p for p in suspicious_paths
-                     if os.path.normcase(os.path.normpath(p)) not in sig_cache]
+                key = _norm_exe(wi.exe_path)
+                if key not in sig_cache:
+                    pending.setdefault(key, wi.exe_path)
+        new_paths = list(pending.values())
         if new_paths:
             logger.debug(f"Checking signatures for {len(new_paths)} suspicious executable(s)")
             new_sigs = _verify_microsoft_signatures(new_paths)
@@ -193,8 +225,15 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
         lolbins = _load_lolbins()
         _auto_trust_microsoft(windows, sig_cache, lolbins)
 
-    suspicious_count = sum(1 for w in windows if w.suspicious)
-    trusted_count = sum(1 for w in windows if w.trusted)
+    # Split into suspicious and normal, counting trusted, in one pass
+    suspicious = []
+    normal = []
+    trusted_count = 0
+    for w in windows:
+        (suspicious if w.suspicious else normal).append(w)
+        if w.trusted:
+            trusted_count += 1
+    suspicious_count = len(suspicious)
     if suspicious_count:
         logger.info(f"Flagged {suspicious_count} suspicious window(s)")
     if trusted_count:
@@ -203,13 +242,9 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     if list_only:
         return windows
 
-    # Split into suspicious and normal. Sort suspicious by concern_level
-    # descending (level 5 first, level 1 last) so highest priority is
-    # processed last and ends up on top of z-order.
-    suspicious = sorted(
-        [w for w in windows if w.suspicious],
-        key=lambda w: w.concern_level, reverse=True)
-    normal = [w for w in windows if not w.suspicious]
+    # Sort suspicious by concern_level descending (level 5 first, level 1
+    # last) so highest priority is processed last and ends up on top of z-order.
+    suspicious.sort(key=operator.attrgetter('concern_level'), reverse=True)
 
     # Compute cascade offsets: position 0 = center (highest priority),
     # outer positions = lower priority. Reverse so first-processed = outermost.
@@ -224,15 +259,21 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     act_on_all = gather_all or filter_pattern is not None
 
     # Process normal windows first (no cascade offset)
-    for wi in normal:
-        if not act_on_all:
-            # Default mode: skip non-suspicious windows
+    if not act_on_all:
+        # Default mode: skip non-suspicious windows
+        for wi in normal:
             wi.action_taken = 'skip:normal'
-            continue
-        if dry_run:
-            _simulate_window(wi, area_x, area_y, area_w, area_h,
-                             show_hidden, include_virtual)
-        else:
+    elif dry_run:
+        for wi in normal:
+            if wi.state in _SIMULATE_BRANCH_STATES:
+                _simulate_window(wi, area_x, area_y, area_w, area_h,
+                                 show_hidden, include_virtual)
+            else:
+                _simulate_center_only(wi, area_x, area_y, area_w, area_h)
+    else:
+        # Serial, in enumeration order: restore activates and center_window
+        # raises each window to HWND_TOP, so order decides the final z-order.
+        for wi in normal:
             was_hidden = wi.state == 'hidden'
             _process_window(platform, wi, area_x, area_y, area_w, area_h,
                             show_hidden, include_virtual)
@@ -259,21 +300,22 @@ def gather_windows(list_only=False, dry_run=False, show_hidden=False,
     if shown_windows and not dry_run:
         save_shown_state(shown_windows)
 
-    # Return sorted: highest concern first, then normal
-    return list(reversed(suspicious)) + normal
+    # Return sorted: highest concern first, then normal (built in place;
+    # suspicious is local to this call)
+    suspicious.reverse()
+    suspicious.extend(normal)
+    return suspicious
+
+
+# Concern level indexed by score (scores of 5 and above are clamped to 5)
+_LEVEL_TABLE = (5, 5, 4, 3, 2, 1)
 
 
 def _score_to_level(score):
     """Map a raw concern score to a DEFCON-style level (1=highest, 5=lowest)."""
-    if score >= 5:
-        return 1
-    if score >= 4:
-        return 2
-    if score >= 3:
-        return 3
-    if score >= 2:
-        return 4
-    return 5
+    if score <= 0:
+        return 5
+    return _LEVEL_TABLE[min(int(score), 5)]
 
 
 def _load_default_trust():
@@ -281,12 +323,13 @@ def _load_default_trust():
 
     Returns list of dicts with at minimum 'pattern'. Entries may also have
     'verify', 'expected_paths', and 'reason' fields for verification.
+    The parse is cached until the file changes; the list is a fresh copy but
+    the entry dicts are shared, so callers must copy an entry before changing it.
     """
     trust_file = Path(__file__).parent / 'default_trust.json'
     try:
-        with open(trust_file, 'r') as f:
-            data = json.load(f)
-        return data.get('processes', [])
+        return list(_cached_json(
+            trust_file, lambda data: tuple(data.get('processes', []))))
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
         logger.warning(f"Could not load default trust file: {trust_file}")
         return []
@@ -295,16 +338,49 @@ def _load_default_trust():
 def _load_lolbins():
     """Load the LOLBin exclusion list (Microsoft-signed binaries to never auto-trust).
 
-    Returns a set of lowercase process name patterns.
+    Returns a frozenset of lowercase process name patterns, cached until the
+    file changes.
     """
     lolbin_file = Path(__file__).parent / 'lolbins.json'
     try:
-        with open(lolbin_file, 'r') as f:
-            data = json.load(f)
-        return set(p.lower() for p in data.get('patterns', []))
+        return _cached_json(
+            lolbin_file,
+            lambda data: frozenset(p.lower() for p in data.get('patterns', [])))
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
         logger.warning(f"Could not load LOLBin list: {lolbin_file}")
-        return set()
+        return frozenset()
+
+
+# Parsed data files: path -> ((mtime_ns, size), built value)
+_json_cache = {}
+
+
+def _cached_json(path, build):
+    """Return build(parsed JSON at path), re-reading only when the file changes.
+
+    The file's (mtime_ns, size) stamp is checked on every call, so edits to
+    the shipped lists are picked up by long-running callers. Errors from
+    open()/json.load() propagate to the caller.
+    """
+    key = str(path)
+    stamp = _file_stamp(path)
+    hit = _json_cache.get(key)
+    if hit is not None and stamp is not None and hit[0] == stamp:
+        return hit[1]
+    with open(path, 'r') as f:
+        value = build(json.load(f))
+    if stamp is not None:
+        _json_cache[key] = (stamp, value)
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_exe(path):
+    """Return the normcase/normpath form of an executable path (sig_cache key).
+
+    Many windows share one executable, so the normalized form is cached.
+    """
+    return os.path.normcase(os.path.normpath(path))
 
 
 def _auto_trust_microsoft(windows, sig_cache, lolbins):
@@ -323,7 +399,7 @@ def _auto_trust_microsoft(windows, sig_cache, lolbins):
             continue
 
         # Check signature cache
-        norm_path = os.path.normcase(os.path.normpath(wi.exe_path))
+        norm_path = _norm_exe(wi.exe_path)
         sig_info = sig_cache.get(norm_path)
         if not sig_info:
             continue
@@ -355,32 +431,315 @@ def _verify_exe_path(exe_path, expected_paths):
     """
     if not exe_path:
         return False
-    norm = os.path.normcase(os.path.normpath(exe_path))
-    for expected in expected_paths:
-        pattern = os.path.normcase(os.path.normpath(expected))
-        if fnmatch.fnmatch(norm, pattern):
-            return True
-    return False
+    expected_re = _expected_paths_re(tuple(expected_paths))
+    return expected_re is not None and expected_re.match(_fast_norm(exe_path)) is not None
+
+
+_SLASH_XLATE = str.maketrans('/', '\\')
+
+
+def _fast_norm(path):
+    """Lowercase a Windows path and unify separators to backslashes.
+
+    Process image paths are already absolute and canonical, so the '.'/'..'
+    handling of normpath (pure Python in ntpath) is not needed here.
+    """
+    return path.lower().translate(_SLASH_XLATE)
+
+
+@functools.lru_cache(maxsize=64)
+def _expected_paths_re(expected_paths):
+    """Compile a tuple of expected-path globs into one regex (None if empty).
+
+    Patterns get the same _fast_norm treatment as the exe path.
+    """
+    if not expected_paths:
+        return None
+    return re.compile('|'.join(
+        f'(?:{fnmatch.translate(_fast_norm(p))})' for p in expected_paths))
+
+
+# Signature results: normalized path -> ((mtime_ns, size), result, last_used).
+# Loaded lazily from sig_cache.json in the state dir and saved back after
+# new verifications, so unchanged binaries skip PowerShell across runs.
+# A file that changes on disk gets a new stamp and is re-verified.
+_sig_memo = None
+SIG_CACHE_MAX_ENTRIES = 5000
+
+
+def _file_stamp(path):
+    """Return (mtime_ns, size) for path, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _get_sig_cache_file():
+    """Return the path to the persistent signature cache."""
+    return _get_state_dir() / 'sig_cache.json'
+
+
+def _load_sig_memo():
+    """Return the signature memo, reading it from disk on first use.
+
+    Persisted entries for paths outside _os_roots() are dropped on load:
+    the file is user-writable and those paths are never trusted from it.
+    """
+    global _sig_memo
+    if _sig_memo is not None:
+        return _sig_memo
+    _sig_memo = {}
+    cache_file = _get_sig_cache_file()
+    try:
+        with open(cache_file, 'r') as f:
+            data = json.load(f)
+        if data.get('version') == 1:
+            roots = _os_roots()
+            for key, rec in data['entries'].items():
+                if roots and not key.startswith(roots):
+                    continue
+                _sig_memo[key] = (
+                    (rec['mtime_ns'], rec['size']),
+                    {'valid': rec['valid'], 'is_os_binary': rec['is_os_binary'],
+                     'signer': rec['signer']},
+                    rec.get('used', 0),
+                )
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug(f"Ignoring unreadable signature cache {cache_file}: {e}")
+    return _sig_memo
+
+
+def _save_sig_memo(memo):
+    """Persist the signature memo, keeping the most recently used entries."""
+    newest = sorted(memo.items(), key=lambda kv: kv[1][2], reverse=True)
+    entries = {}
+    for key, ((mtime_ns, size), result, used) in newest[:SIG_CACHE_MAX_ENTRIES]:
+        entries[key] = dict(result, mtime_ns=mtime_ns, size=size, used=used)
+    cache_file = _get_sig_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(cache_file, {'version': 1, 'entries': entries})
+    except OSError as e:
+        logger.debug(f"Could not save signature cache {cache_file}: {e}")
 
 
 def _verify_microsoft_signatures(exe_paths):
     """Batch-verify Authenticode signatures for multiple executables.
 
-    Uses a single PowerShell invocation to check all paths at once.
-    Returns dict mapping path -> {'valid': bool, 'is_os_binary': bool, 'signer': str}.
+    Paths already verified (in this or an earlier run) and unchanged on disk
+    are served from the signature cache. Paths outside the Windows and
+    Program Files roots are reported as not-valid, non-OS binaries without
+    being checked. The rest are checked in-process via wintrust (in
+    parallel), falling back to PowerShell for any path the native check
+    can't handle. Returns dict mapping path -> {'valid': bool,
+    'is_os_binary': bool, 'signer': str}.
     """
     if not exe_paths:
         return {}
 
     # Deduplicate and filter
-    unique_paths = list(set(p for p in exe_paths if p))
+    memo = _load_sig_memo()
+    now = time.time()
+    results = {}
+    stamps = {}
+    unique_paths = []
+    # Anything outside the OS install roots can't be a Microsoft OS binary.
+    # Checked before the memo: sig_cache.json lives in a user-writable
+    # directory, so a cached verdict alone must never vouch for such a path.
+    roots = _os_roots()
+    for p in set(p for p in exe_paths if p):
+        key = _norm_exe(p)
+        if roots and not key.startswith(roots):
+            results[key] = dict(_NOT_OS_BINARY)
+            memo.pop(key, None)
+            continue
+        stamp = _file_stamp(p)
+        cached = memo.get(key)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            results[key] = cached[1]
+            memo[key] = (stamp, cached[1], now)
+        else:
+            stamps[key] = stamp
+            unique_paths.append(p)
     if not unique_paths:
-        return {}
+        return results
+
+    fresh = {}
+    fallback = []
+    if _load_wintrust() is not None:
+        # WTGetSignatureInfo blocks in native code with the GIL released
+        workers = min(SIG_VERIFY_WORKERS, len(unique_paths))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for p, result in zip(unique_paths,
+                                 pool.map(_verify_signature_native, unique_paths)):
+                if result is None:
+                    fallback.append(p)
+                else:
+                    fresh[_norm_exe(p)] = result
+    else:
+        fallback = unique_paths
+    if fallback:
+        fresh.update(_verify_signatures_powershell(fallback))
+
+    for key, result in fresh.items():
+        results[key] = result
+        if stamps.get(key) is not None:
+            memo[key] = (stamps[key], result, now)
+    if fresh:
+        _save_sig_memo(memo)
+
+    return results
+
 
+# Result reported for files outside _os_roots() (never checked or cached)
+_NOT_OS_BINARY = {'valid': False, 'is_os_binary': False, 'signer': ''}
+
+
+@functools.lru_cache(maxsize=1)
+def _os_roots():
+    """Normalized OS install directories (with trailing separator) as a tuple.
+
+    Empty when none of the environment variables are set (non-Windows), in
+    which case no path is ruled out.
+    """
+    roots = set()
+    for var in ('SystemRoot', 'WINDIR', 'ProgramFiles', 'ProgramFiles(x86)',
+                'ProgramW6432'):
+        value = os.environ.get(var)
+        if value:
+            roots.add(os.path.join(_norm_exe(value), ''))
+    return tuple(sorted(roots))
+
+
+# Native signature checks via wintrust.dll (Windows only; loaded lazily)
+SIG_VERIFY_WORKERS = 8
+_SIF_AUTHENTICODE_SIGNED = 0x0001
+_SIF_CATALOG_SIGNED = 0x0002
+_SIF_BASE_VERIFICATION = 0x0100
+_SIF_CATALOG_FIRST = 0x0200
+_SIF_CHECK_OS_BINARY = 0x0800
+# Same flags Get-AuthenticodeSignature passes, so results match PowerShell
+_SIF_FLAGS = (_SIF_CATALOG_SIGNED | _SIF_CATALOG_FIRST | _SIF_AUTHENTICODE_SIGNED
+              | _SIF_BASE_VERIFICATION | _SIF_CHECK_OS_BINARY)
+_SIGNATURE_STATE_VALID = 5
+_SIGNATURE_STATE_TRUSTED = 6
+_CERT_NAME_RDN_TYPE = 2
+_CERT_X500_NAME_STR = 3
+_CERT_NAME_STR_REVERSE_FLAG = 0x02000000
+_wintrust = None
+
+
+def _load_wintrust():
+    """Return (WTGetSignatureInfo, crypt32, SIGNATURE_INFO) or None if unavailable."""
+    global _wintrust
+    if _wintrust is None:
+        try:
+            import ctypes.wintypes as wt
+            wintrust = ctypes.WinDLL('wintrust')
+            crypt32 = ctypes.WinDLL('crypt32')
+            get_signature_info = wintrust.WTGetSignatureInfo
+        except (AttributeError, OSError, ValueError):
+            _wintrust = False
+            return None
+
+        class SIGNATURE_INFO(ctypes.Structure):
+            _fields_ = [
+                ('cbSize', wt.DWORD),
+                ('nSignatureState', ctypes.c_int),
+                ('nSignatureType', ctypes.c_int),
+                ('dwSignatureInfoAvailability', wt.DWORD),
+                ('dwInfoAvailability', wt.DWORD),
+                ('pszDisplayName', wt.LPWSTR),
+                ('cchDisplayName', wt.DWORD),
+                ('pszPublisherName', wt.LPWSTR),
+                ('cchPublisherName', wt.DWORD),
+                ('pszMoreInfoURL', wt.LPWSTR),
+                ('cchMoreInfoURL', wt.DWORD),
+                ('prgbHash', ctypes.c_void_p),
+                ('cbHash', wt.DWORD),
+                ('fOSBinary', wt.BOOL),
+            ]
+
+        get_signature_info.argtypes = [
+            wt.LPCWSTR, wt.HANDLE, ctypes.c_int, ctypes.POINTER(SIGNATURE_INFO),
+            ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p]
+        get_signature_info.restype = ctypes.c_long  # HRESULT
+        crypt32.CertGetNameStringW.argtypes = [
+            ctypes.c_void_p, wt.DWORD, wt.DWORD, ctypes.c_void_p,
+            wt.LPWSTR, wt.DWORD]
+        crypt32.CertGetNameStringW.restype = wt.DWORD
+        crypt32.CertFreeCertificateContext.argtypes = [ctypes.c_void_p]
+        _wintrust = (get_signature_info, crypt32, SIGNATURE_INFO)
+    return _wintrust or None
+
+
+def _verify_signature_native(path):
+    """Check one file's signature in-process; None means 'ask PowerShell'."""
+    get_signature_info, crypt32, SIGNATURE_INFO = _load_wintrust()
+    info = SIGNATURE_INFO()
+    info.cbSize = ctypes.sizeof(SIGNATURE_INFO)
+    cert = ctypes.c_void_p()
+    try:
+        hr = get_signature_info(path, None, _SIF_FLAGS, ctypes.byref(info),
+                                ctypes.byref(cert), None)
+        if hr != 0:
+            return None
+        signer = ''
+        if cert:
+            name_type = ctypes.c_uint32(_CERT_X500_NAME_STR | _CERT_NAME_STR_REVERSE_FLAG)
+            buf = ctypes.create_unicode_buffer(512)
+            if crypt32.CertGetNameStringW(cert, _CERT_NAME_RDN_TYPE, 0,
+                                          ctypes.byref(name_type), buf, len(buf)) > 1:
+                signer = buf.value
+        return {
+            'valid': info.nSignatureState in (_SIGNATURE_STATE_VALID,
+                                              _SIGNATURE_STATE_TRUSTED),
+            'is_os_binary': bool(info.fOSBinary),
+            'signer': signer,
+        }
+    except OSError as e:
+        logger.debug(f"Native signature check failed for {path}: {e}")
+        return None
+    finally:
+        if cert:
+            crypt32.CertFreeCertificateContext(cert)
+
+
+# PowerShell fallback: lists longer than this are split into chunks of this
+# size and run as concurrent powershell.exe processes
+POWERSHELL_CHUNK_SIZE = 8
+
+
+def _verify_signatures_powershell(paths):
+    """Check signatures with Get-AuthenticodeSignature.
+
+    Short lists run as one PowerShell invocation; longer ones are split into
+    chunks verified concurrently, so one slow file doesn't serialize the rest.
+    Returns dict mapping normalized path -> result; paths PowerShell didn't
+    report on are absent.
+    """
+    size = POWERSHELL_CHUNK_SIZE
+    if len(paths) <= size:
+        return _run_authenticode_script(paths)
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+    results = {}
+    workers = min(len(chunks), os.cpu_count() or 1, SIG_VERIFY_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(_run_authenticode_script, chunks):
+            results.update(chunk_results)
+    return results
+
+
+def _run_authenticode_script(paths):
+    """Run one PowerShell process that checks every path in paths."""
     # Build a PowerShell script that checks all paths in one invocation
     # Output format: path|Status|IsOSBinary|SignerSubject (one per line)
     lines = []
-    for p in unique_paths:
+    for p in paths:
         escaped = p.replace("'", "''")
         lines.append(
             f"$s = Get-AuthenticodeSignature '{escaped}'; "
@@ -402,7 +761,7 @@ def _verify_microsoft_signatures(exe_paths):
                 status = parts[1].strip()
                 is_os = parts[2].strip().lower() == 'true'
                 signer = parts[3].strip() if len(parts) > 3 else ''
-                results[os.path.normcase(os.path.normpath(path))] = {
+                results[_norm_exe(path)] = {
                     'valid': status == 'Valid',
                     'is_os_binary': is_os,
                     'signer': signer,
@@ -427,62 +786,91 @@ def _flag_suspicious(windows, trust_entries=None, sig_cache=None):
     """
     sig_cache = sig_cache or {}
 
+    # Loop-invariant names bound as locals (LOAD_FAST in the per-window loop)
+    check_trust = _check_trust if trust_entries else None
+    score_to_level = _score_to_level
+    mask_scores = _MASK_SCORES
+    bits = CONCERN_BITS
+
+    # Many windows share a process: the trust verdict depends only on
+    # (process_name, exe_path), so compute it once per distinct pair.
+    trust_memo = {}
+
     for wi in windows:
         # Check trust (but don't skip -- we still compute indicators)
-        trust_result = _check_trust(wi, trust_entries, sig_cache) if trust_entries else None
+        if check_trust:
+            key = (wi.process_name, wi.exe_path)
+            if key in trust_memo:
+                trust_result = trust_memo[key]
+            else:
+                trust_result = trust_memo[key] = check_trust(
+                    wi, trust_entries, sig_cache)
+        else:
+            trust_result = None
         # trust_result: None, ('trusted', entry), or ('failed', entry, fail_reason)
 
-        indicators = []  # (reason_text, weight_key)
+        reasons = []  # human-readable reason per indicator
+        mask = 0      # OR of CONCERN_BITS for the indicators that fired
 
         # --- Verification failure indicator ---
         # Process name matches a trusted entry but verification failed.
         # This is a high concern: something is masquerading as a system process.
         if trust_result and trust_result[0] == 'failed':
             fail_reason = trust_result[2]
-            indicators.append((f'trust-verify-failed({fail_reason})',
-                               'trust-verification-failed'))
+            reasons.append(f'trust-verify-failed({fail_reason})')
+            mask |= bits['trust-verification-failed']
 
         # --- Positional indicators ---
+        # Geometry is read into locals once; each check below reuses them.
+        state = wi.state
+        width, height = wi.width, wi.height
 
-        if wi.state == 'off-screen':
-            indicators.append(('off-screen', 'off-screen'))
+        if state == 'off-screen':
+            reasons.append('off-screen')
+            mask |= bits['off-screen']
 
         # Cloaked windows can also be positionally off-screen -- check that
         # separately since state='cloaked' takes priority over 'off-screen'
-        if wi.state == 'cloaked' and wi.is_off_screen:
-            indicators.append(('off-screen', 'off-screen'))
+        if state == 'cloaked' and wi.is_off_screen:
+            reasons.append('off-screen')
+            mask |= bits['off-screen']
 
         # Heavily shrunk: visible but tiny (not just minimized to taskbar)
-        if wi.state not in ('minimized', 'hidden'):
-            if 0 < wi.width < MIN_SANE_WIDTH or 0 < wi.height < MIN_SANE_HEIGHT:
-                indicators.append((f'shrunk({wi.width}x{wi.height})', 'shrunk'))
+        if state not in _SHRINK_EXEMPT_STATES:
+            if 0 < width < MIN_SANE_WIDTH or 0 < height < MIN_SANE_HEIGHT:
+                reasons.append(f'shrunk({width}x{height})')
+                mask |= bits['shrunk']
 
         # Positioned partially off-screen (pushed mostly past a screen edge)
-        if wi.state in ('normal', 'cloaked'):
-            if wi.x < -wi.width // 2 or wi.y < -wi.height // 2:
-                indicators.append(('partially-off-screen', 'partially-off-screen'))
+        if state in _EDGE_CHECK_STATES:
+            if wi.x < -width // 2 or wi.y < -height // 2:
+                reasons.append('partially-off-screen')
+                mask |= bits['partially-off-screen']
 
         # --- Type indicators ---
 
         # Dialog/popup windows -- transient by nature, persistence is odd
         if wi.class_name in DIALOG_CLASSES:
-            indicators.append((f'dialog({wi.class_name})', 'dialog'))
+            reasons.append(f'dialog({wi.class_name})')
+            mask |= bits['dialog']
 
         # --- Cloaking indicators ---
         # Cloaking is a legitimate OS feature but still worth noting at low
         # concern. Can be abused, and compounds with other indicators.
         if wi.cloaked_type:
-            indicators.append(('cloaked', 'cloaked'))
+            reasons.append('cloaked')
+            mask |= bits['cloaked']
             # Shell/inherited cloaking: OS hid it (not user moving to desktop)
             if wi.cloaked_type & 0x6:
-                indicators.append(('shell-cloaked', 'shell-cloaked'))
+                reasons.append('shell-cloaked')
+                mask |= bits['shell-cloaked']
 
         # --- Score and level ---
 
-        if indicators:
-            reasons = [r for r, _ in indicators]
-            score = sum(CONCERN_WEIGHTS.get(key, 1) for _, key in indicators)
-            level = _score_to_level(score)
+        wi.concern_mask = mask
+        if mask:
+            score = mask_scores[mask]
+            level = score_to_level(score)
 
             is_trusted = trust_result and trust_result[0] == 'trusted'
             if is_trusted:
@@ -512,82 +900,133 @@ def _check_trust(wi, trust_entries, sig_cache):
     """
     proc_lower = wi.process_name.lower()
 
-    for entry in trust_entries:
-        if not fnmatch.fnmatch(proc_lower, entry['pattern'].lower()):
-            continue
+    # Literal patterns resolve with a dict lookup; wildcard patterns are only
+    # tried when their union regex hits, and only those listed before the
+    # literal hit, so the first matching entry still wins.
+    patterns = tuple(e['pattern'] for e in trust_entries)
+    exact, wild_indices, wild_re = _trust_index(patterns)
+    first = exact.get(proc_lower)
+    if wild_re is not None and wild_re.match(proc_lower):
+        for i in wild_indices:
+            if first is not None and i > first:
+                break
+            if _glob_union((patterns[i],)).match(proc_lower):
+                first = i
+                break
+    if first is None:
+        return None
 
-        # Name matched. Check if verification is required.
-        verify = entry.get('verify')
-        if not verify:
-            # No verification needed (user trust or unverified default)
-            return ('trusted', entry)
-
-        # --- Path verification ---
-        expected_paths = entry.get('expected_paths')
-        if expected_paths:
-            if not _verify_exe_path(wi.exe_path, expected_paths):
-                actual = wi.exe_path or 'unknown'
-                logger.warning(
-                    f"Trust verification FAILED for {wi.process_name}: "
-                    f"path '{actual}' doesn't match expected locations")
-                return ('failed', entry, f'unexpected-path:{actual}')
-
-        # --- Signature verification (Microsoft OS binary) ---
-        if verify == 'microsoft' and wi.exe_path:
-            norm_path = os.path.normcase(os.path.normpath(wi.exe_path))
-            sig_info = sig_cache.get(norm_path)
-            if sig_info is None:
-                logger.warning(
-                    f"Trust verification FAILED for {wi.process_name}: "
-                    f"no signature data for '{wi.exe_path}'")
-                return ('failed', entry, 'signature-not-checked')
-            if not sig_info['valid']:
-                logger.warning(
-                    f"Trust verification FAILED for {wi.process_name}: "
-                    f"invalid signature on '{wi.exe_path}'")
-                return ('failed', entry, 'invalid-signature')
-            if not sig_info['is_os_binary']:
-                logger.warning(
-                    f"Trust verification FAILED for {wi.process_name}: "
-                    f"not a Microsoft OS binary '{wi.exe_path}'")
-                return ('failed', entry, 'not-os-binary')
+    entry = trust_entries[first]
 
+    # Name matched. Check if verification is required.
+    verify = entry.get('verify')
+    if not verify:
+        # No verification needed (user trust or unverified default)
         return ('trusted', entry)
 
-    return None
+    # --- Path verification ---
+    expected_paths = entry.get('expected_paths')
+    if expected_paths:
+        if not _verify_exe_path(wi.exe_path, expected_paths):
+            actual = wi.exe_path or 'unknown'
+            logger.warning(
+                f"Trust verification FAILED for {wi.process_name}: "
+                f"path '{actual}' doesn't match expected locations")
+            return ('failed', entry, f'unexpected-path:{actual}')
+
+    # --- Signature verification (Microsoft OS binary) ---
+    if verify == 'microsoft' and wi.exe_path:
+        norm_path = _norm_exe(wi.exe_path)
+        sig_info = sig_cache.get(norm_path)
+        if sig_info is None:
+            logger.warning(
+                f"Trust verification FAILED for {wi.process_name}: "
+                f"no signature data for '{wi.exe_path}'")
+            return ('failed', entry, 'signature-not-checked')
+        if not sig_info['valid']:
+            logger.warning(
+                f"Trust verification FAILED for {wi.process_name}: "
+                f"invalid signature on '{wi.exe_path}'")
+            return ('failed', entry, 'invalid-signature')
+        if not sig_info['is_os_binary']:
+            logger.warning(
+                f"Trust verification FAILED for {wi.process_name}: "
+                f"not a Microsoft OS binary '{wi.exe_path}'")
+            return ('failed', entry, 'not-os-binary')
+
+    return ('trusted', entry)
+
+
+def _compile_globs(patterns):
+    """Compile fnmatch patterns into a single alternation regex.
+
+    Patterns are lowercased, so match the result against lowercased strings.
+    Returns None when there are no patterns. Translating once per run replaces
+    an fnmatch call per (window, pattern) pair with one regex match per window.
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(
+        f'(?:{fnmatch.translate(p.lower())})' for p in patterns))
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_union(patterns):
+    """Cached _compile_globs() for a non-empty tuple of patterns."""
+    return _compile_globs(patterns)
+
+
+@functools.lru_cache(maxsize=32)
+def _trust_index(patterns):
+    """Split trust patterns into literal and wildcard lookups.
+
+    Returns (exact, wild_indices, wild_re): exact maps a lowercased literal
+    name to the index of its first entry, wild_indices lists wildcard entry
+    indices in order, and wild_re is their union regex (None if there are
+    none).
+    """
+    exact = {}
+    wild_indices = []
+    for i, pattern in enumerate(patterns):
+        if any(c in pattern for c in '*?['):
+            wild_indices.append(i)
+        else:
+            exact.setdefault(pattern.lower(), i)
+    wild_re = _glob_union(tuple(patterns[i] for i in wild_indices)) if wild_indices else None
+    return exact, tuple(wild_indices), wild_re
 
 
 def _apply_filters(windows, include_pattern, exclude_pattern):
     """Apply fnmatch include/exclude filters on title and process name."""
-    filtered = []
-    for wi in windows:
-        match_str = f"{wi.title} {wi.process_name}".lower()
+    keep_re = _compile_filter(include_pattern, exclude_pattern)
+    if keep_re is None:
+        return list(windows)
+    keep = keep_re.match
+    return [wi for wi in windows
+            if keep(f"{wi.title} {wi.process_name}".lower())]
 
-        if include_pattern:
-            if not fnmatch.fnmatch(match_str, include_pattern.lower()):
-                continue
 
-        if exclude_pattern:
-            if fnmatch.fnmatch(match_str, exclude_pattern.lower()):
-                continue
+def _compile_filter(include_pattern, exclude_pattern):
+    """Compile include/exclude globs into one regex that matches kept strings.
 
-        filtered.append(wi)
-    return filtered
+    The include glob becomes a lookahead and the exclude glob a negative
+    lookahead, so one match per window decides both. Returns None when
+    neither pattern is set.
+    """
+    parts = []
+    if include_pattern:
+        parts.append(f'(?={fnmatch.translate(include_pattern.lower())})')
+    if exclude_pattern:
+        parts.append(f'(?!{fnmatch.translate(exclude_pattern.lower())})')
+    return re.compile(''.join(parts)) if parts else None
 
 
 def _exclude_by_process(windows, exclude_processes):
     """Remove windows whose process name matches any exclusion pattern."""
-    filtered = []
-    for wi in windows:
-        proc_lower = wi.process_name.lower()
-        excluded = False
-        for pattern in exclude_processes:
-            if fnmatch.fnmatch(proc_lower, pattern.lower()):
-                excluded = True
-                break
-        if not excluded:
-            filtered.append(wi)
-    return filtered
+    exclude_re = _compile_globs(exclude_processes)
+    if exclude_re is None:
+        return list(windows)
+    return [wi for wi in windows if not exclude_re.match(wi.process_name.lower())]
 
 
 def _compute_centered_position(wi, area_x, area_y, area_w, area_h,
@@ -609,45 +1048,80 @@ def _compute_centered_position(wi, area_x, area_y, area_w, area_h,
     return cx, cy
 
 
+# States for which _simulate_window does more than plain centering
+_SIMULATE_BRANCH_STATES = frozenset(('minimized', 'hidden', 'cloaked'))
+
+
+def _simulate_center_only(wi, area_x, area_y, area_w, area_h):
+    """Dry-run fast path for a non-suspicious, visible window with no offset.
+
+    Equivalent to _simulate_window's final branch for states outside
+    _SIMULATE_BRANCH_STATES when wi.suspicious is False.
+    """
+    if wi.width < MIN_SANE_WIDTH or wi.height < MIN_SANE_HEIGHT:
+        wi.action_taken = 'would:center+resize'
+    else:
+        wi.action_taken = 'would:center'
+    wi.target_x, wi.target_y = _compute_centered_position(
+        wi, area_x, area_y, area_w, area_h)
+
+
 def _simulate_window(wi, area_x, area_y, area_w, area_h,
                      show_hidden, include_virtual, act_on_all=True,
                      offset_x=0, offset_y=0):
     """Dry-run: determine what action would be taken and compute target position."""
+    handler = _SIMULATE_HANDLERS.get(wi.state, _simulate_center)
+    handler(wi, (area_x, area_y, area_w, area_h, offset_x, offset_y),
+            show_hidden, include_virtual, act_on_all)
 
-    # Collapsed/tiny window annotation
-    is_tiny = wi.width < MIN_SANE_WIDTH or wi.height < MIN_SANE_HEIGHT
-    resize_note = '+resize' if is_tiny and wi.state != 'hidden' else ''
-    fg_note = '+foreground' if wi.suspicious else ''
 
-    if wi.state == 'minimized':
-        wi.action_taken = f'would:restore{resize_note}+center{fg_note}'
-        wi.target_x, wi.target_y = _compute_centered_position(
-            wi, area_x, area_y, area_w, area_h, offset_x, offset_y)
+# Per-state dry-run handlers. geometry is (area_x, area_y, area_w, area_h,
+# offset_x, offset_y); notes are only built by the branches that use them.
 
-    elif wi.state == 'hidden' and show_hidden:
-        if act_on_all or wi.suspicious:
-            wi.action_taken = f'would:show{resize_note}+center{fg_note}'
-            wi.target_x, wi.target_y = _compute_centered_position(
-                wi, area_x, area_y, area_w, area_h, offset_x, offset_y)
-        else:
-            wi.action_taken = 'skip:hidden-normal'
+def _resize_note(wi):
+    """'+resize' for collapsed/tiny windows, else ''."""
+    return '+resize' if wi.width < MIN_SANE_WIDTH or wi.height < MIN_SANE_HEIGHT else ''
 
-    elif wi.state == 'hidden' and not show_hidden:
+
+def _simulate_minimized(wi, geometry, show_hidden, include_virtual, act_on_all):
+    fg_note = '+foreground' if wi.suspicious else ''
+    wi.action_taken = f'would:restore{_resize_note(wi)}+center{fg_note}'
+    wi.target_x, wi.target_y = _compute_centered_position(wi, *geometry)
+
+
+def _simulate_hidden(wi, geometry, show_hidden, include_virtual, act_on_all):
+    if not show_hidden:
         wi.action_taken = 'skip:hidden'
+    elif act_on_all or wi.suspicious:
+        # Hidden windows are restored at their own size: no resize note
+        fg_note = '+foreground' if wi.suspicious else ''
+        wi.action_taken = f'would:show+center{fg_note}'
+        wi.target_x, wi.target_y = _compute_centered_position(wi, *geometry)
+    else:
+        wi.action_taken = 'skip:hidden-normal'
 
-    elif wi.state == 'cloaked':
-        if include_virtual or wi.suspicious:
-            wi.action_taken = f'would:pull-desktop{resize_note}+center{fg_note}'
-            wi.target_x, wi.target_y = _compute_centered_position(
-                wi, area_x, area_y, area_w, area_h, offset_x, offset_y)
-        else:
-            wi.action_taken = 'skip:cloaked'
 
+def _simulate_cloaked(wi, geometry, show_hidden, include_virtual, act_on_all):
+    if include_virtual or wi.suspicious:
+        fg_note = '+foreground' if wi.suspicious else ''
+        wi.action_taken = f'would:pull-desktop{_resize_note(wi)}+center{fg_note}'
+        wi.target_x, wi.target_y = _compute_centered_position(wi, *geometry)
     else:
-        # normal, maximized, off-screen -- would be centered
-        wi.action_taken = f'would:center{resize_note}{fg_note}'
-        wi.target_x, wi.target_y = _compute_centered_position(
-            wi, area_x, area_y, area_w, area_h, offset_x, offset_y)
+        wi.action_taken = 'skip:cloaked'
+
+
+def _simulate_center(wi, geometry, show_hidden, include_virtual, act_on_all):
+    # normal, maximized, off-screen -- would be centered
+    fg_note = '+foreground' if wi.suspicious else ''
+    wi.action_taken = f'would:center{_resize_note(wi)}{fg_note}'
+    wi.target_x, wi.target_y = _compute_centered_position(wi, *geometry)
+
+
+_SIMULATE_HANDLERS = {
+    'minimized': _simulate_minimized,
+    'hidden': _simulate_hidden,
+    'cloaked': _simulate_cloaked,
+}
 
 
 def _process_window(platform, wi, area_x, area_y, area_w, area_h,
@@ -729,6 +1203,25 @@ def _get_state_file():
     return _get_state_dir() / 'last_shown.json'
 
 
+def _write_json_atomic(path, data):
+    """Write data as compact JSON to path via a temp file and os.replace().
+
+    Readers never see a partially written file; on error the temp file is
+    removed and the previous contents are left intact.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def save_shown_state(windows_shown):
     """Save a record of windows that were made visible by --show-hidden.
 
@@ -739,14 +1232,12 @@ def save_shown_state(windows_shown):
     state_dir = _get_state_dir()
     state_dir.mkdir(parents=True, exist_ok=True)
 
-    records = []
-    for wi in windows_shown:
-        records.append({
-            'hwnd': wi.handle,
-            'pid': wi.pid,
-            'process_name': wi.process_name,
-            'title': wi.title,
-        })
+    records = [{
+        'hwnd': wi.handle,
+        'pid': wi.pid,
+        'process_name': wi.process_name,
+        'title': wi.title,
+    } for wi in windows_shown]
 
     state = {
         'version': 1,
@@ -756,8 +1247,7 @@ def save_shown_state(windows_shown):
     }
 
     state_file = _get_state_file()
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    _write_json_atomic(state_file, state)
 
     logger.info(f"Saved undo state: {len(records)} window(s) to {state_file}")
     return state_file
@@ -770,25 +1260,43 @@ def undo_show_hidden():
     the original PID, then hides it. Returns (hidden_count, skipped_count).
     """
     state_file = _get_state_file()
-    if not state_file.exists():
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+    except FileNotFoundError:
         logger.error("No undo state found. Run with --show-hidden first.")
         return 0, 0
 
-    with open(state_file, 'r') as f:
-        state = json.load(f)
-
     records = state.get('windows_shown', [])
     if not records:
         logger.info("Undo state is empty — nothing to re-hide.")
         state_file.unlink(missing_ok=True)
         return 0, 0
 
+    try:
+        import win32gui
+        import win32process
+    except ImportError:
+        logger.error("pywin32 is required to undo --show-hidden.")
+        return 0, len(records)
+
     timestamp = state.get('timestamp', 'unknown')
     logger.info(f"Undo state from {timestamp}: {len(records)} window(s)")
 
     platform = get_platform()
     platform.setup()
 
+    # Snapshot every top-level window once (hwnd -> (pid, visible)) rather
+    # than making two user32 calls per record.
+    live = {}
+
+    def _snapshot(hwnd, _):
+        live[hwnd] = (win32process.GetWindowThreadProcessId(hwnd)[1],
+                      bool(win32gui.IsWindowVisible(hwnd)))
+        return True
+
+    win32gui.EnumWindows(_snapshot, None)
+
     hidden_count = 0
     skipped_count = 0
 
@@ -799,15 +1307,13 @@ def undo_show_hidden():
         title = rec.get('title', '<untitled>')
 
         # Validate: check if the HWND still exists and belongs to the same PID
-        try:
-            import win32process
-            import win32gui
-            _, actual_pid = win32process.GetWindowThreadProcessId(hwnd)
-        except Exception:
+        current = live.get(hwnd)
+        if current is None:
             logger.debug(f"  Skip: HWND {hwnd} no longer exists ({proc_name}: {title})")
             skipped_count += 1
             continue
 
+        actual_pid, is_visible = current
         if actual_pid != expected_pid:
             logger.debug(
                 f"  Skip: HWND {hwnd} PID changed {expected_pid} -> {actual_pid} "
@@ -815,20 +1321,13 @@ def undo_show_hidden():
             skipped_count += 1
             continue
 
-        # Check if window is currently visible (no point hiding an already-hidden window)
-        try:
-            is_visible = win32gui.IsWindowVisible(hwnd)
-        except Exception:
-            skipped_count += 1
-            continue
-
+        # No point hiding an already-hidden window
         if not is_visible:
             logger.debug(f"  Skip: HWND {hwnd} already hidden ({proc_name}: {title})")
             skipped_count += 1
             continue
 
         # Create a minimal WindowInfo for the platform hide call
-        from wingather.platforms.base import WindowInfo
         wi = WindowInfo(
             handle=hwnd, title=title, class_name='',
             process_name=proc_name, pid=expected_pid,
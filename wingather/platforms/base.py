@@ -6,6 +6,19 @@ from abc import ABC, abstractmethod
 class WindowInfo:
     """Represents a discovered window."""
 
+    # Slotted: one instance per enumerated HWND, and the scoring/rendering
+    # passes read and write these attributes for every window.
+    __slots__ = (
+        'handle', 'title', 'class_name', 'process_name', 'pid',
+        'x', 'y', 'width', 'height', 'state', 'is_visible',
+        'exe_path', 'action_taken', 'target_x', 'target_y',
+        'cloaked_type', 'is_off_screen',
+        'suspicious', 'suspicious_reason', 'concern_level', 'concern_score',
+        'concern_mask',
+        'trusted', 'trust_source', 'trust_pattern', 'trust_verified',
+        'would_flag_reason', 'would_concern_level', 'would_concern_score',
+    )
+
     def __init__(self, handle, title, class_name, process_name, pid,
                  x, y, width, height, state, is_visible):
         self.handle = handle
@@ -29,6 +42,7 @@ class WindowInfo:
         self.suspicious_reason = None
         self.concern_level = 0       # 0=none, 1=highest(DEFCON 1), 5=lowest(informational)
         self.concern_score = 0       # Raw score from accumulated indicators
+        self.concern_mask = 0        # OR of core.CONCERN_BITS that fired (set even if trusted)
         self.trusted = False         # True if process matched trust list (flagging suppressed)
         self.trust_source = None     # 'default' or 'user'
         self.trust_pattern = None    # The pattern that matched
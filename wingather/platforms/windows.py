@@ -1,9 +1,12 @@
 """Windows implementation of window enumeration and manipulation."""
 
+import concurrent.futures
 import ctypes
 import ctypes.wintypes
 import logging
 import os
+import threading
+import time
 
 from wingather.platforms.base import PlatformBase, WindowInfo
 
@@ -11,7 +14,6 @@ logger = logging.getLogger(__name__)
 
 # Lazy imports - only loaded on Windows
 win32gui = None
-win32con = None
 win32process = None
 win32api = None
 psutil = None
@@ -19,17 +21,15 @@ psutil = None
 
 def _load_win32():
     """Lazy-load pywin32 modules."""
-    global win32gui, win32con, win32process, win32api, psutil
+    global win32gui, win32process, win32api, psutil
     if win32gui is not None:
         return
     try:
         import win32gui as _win32gui
-        import win32con as _win32con
         import win32process as _win32process
         import win32api as _win32api
         import psutil as _psutil
         win32gui = _win32gui
-        win32con = _win32con
         win32process = _win32process
         win32api = _win32api
         psutil = _psutil
@@ -71,11 +71,35 @@ def _get_comtypes_guids():
     return IID, CLSID
 
 
+_ivdm_class = None
+
+# IVirtualDesktopManager proxy per thread: a COM proxy belongs to the
+# apartment of the thread that created it, so it is only shared within that
+# thread across VirtualDesktopHelper instances and released when it exits.
+_vd_local = threading.local()
+
+
+def _get_vd_manager():
+    """Return this thread's IVirtualDesktopManager, creating it on first use."""
+    manager = getattr(_vd_local, 'manager', None)
+    if manager is None:
+        _, CLSID = _get_comtypes_guids()
+        manager = _vd_local.manager = _comtypes.CoCreateInstance(
+            CLSID,
+            interface=_build_ivdm_class(),
+        )
+    return manager
+
+
 def _build_ivdm_class():
     """Build the IVirtualDesktopManager COM interface class dynamically.
 
-    Done lazily so comtypes is only imported when actually needed.
+    Done lazily so comtypes is only imported when actually needed; built
+    once per process.
     """
+    global _ivdm_class
+    if _ivdm_class is not None:
+        return _ivdm_class
     _load_comtypes()
     IID, _ = _get_comtypes_guids()
 
@@ -99,7 +123,8 @@ def _build_ivdm_class():
             ),
         ]
 
-    return IVirtualDesktopManager
+    _ivdm_class = IVirtualDesktopManager
+    return _ivdm_class
 
 
 class VirtualDesktopHelper:
@@ -119,12 +144,7 @@ class VirtualDesktopHelper:
     def _init(self):
         try:
             _load_comtypes()
-            _, CLSID = _get_comtypes_guids()
-            IVDMClass = _build_ivdm_class()
-            self._manager = _comtypes.CoCreateInstance(
-                CLSID,
-                interface=IVDMClass,
-            )
+            self._manager = _get_vd_manager()
             self._available = True
             logger.debug("IVirtualDesktopManager COM interface available")
         except Exception as e:
@@ -193,7 +213,7 @@ class VirtualDesktopHelper:
 
 
 # Window classes that should always be excluded (system/shell windows)
-SYSTEM_CLASSES = {
+SYSTEM_CLASSES = frozenset({
     'Progman',                      # Desktop (Program Manager)
     'Shell_TrayWnd',                # Taskbar
     'Shell_SecondaryTrayWnd',       # Secondary monitor taskbar
@@ -207,7 +227,7 @@ SYSTEM_CLASSES = {
     'MSCTFIME UI',                  # Text input framework
     'EdgeUiInputTopWndClass',       # Edge UI input
     'EdgeUiInputWndClass',          # Edge UI input
-}
+})
 
 # DWM constants for cloaked window detection
 DWMWA_CLOAKED = 14
@@ -215,10 +235,224 @@ DWM_CLOAKED_APP = 1
 DWM_CLOAKED_SHELL = 2
 DWM_CLOAKED_INHERITED = 4
 
+# enumerate_windows inspects windows on a thread pool above this many hwnds
+ENUM_PARALLEL_THRESHOLD = 32
+ENUM_WORKERS = 8
+
+# Seconds a monitor enumeration is reused by _get_all_monitors
+MONITOR_CACHE_TTL = 2.0
+
 # ShowWindow constants
 SW_RESTORE = 9
 SW_SHOW = 5
 SW_SHOWNOACTIVATE = 4
+SW_HIDE = 0
+
+# SetWindowPos constants
+HWND_TOP = 0
+SWP_SHOWWINDOW = 0x0040
+
+# Window style constants
+GWL_STYLE = -16
+GWL_EXSTYLE = -20
+WS_CHILD = 0x40000000
+WS_MINIMIZE = 0x20000000
+WS_MAXIMIZE = 0x01000000
+WS_EX_TOOLWINDOW = 0x00000080
+
+# Window state by condition bits, first match wins in this priority order
+_STATE_MINIMIZED = 16
+_STATE_HIDDEN = 8
+_STATE_CLOAKED = 4
+_STATE_OFF_SCREEN = 2
+_STATE_MAXIMIZED = 1
+_STATE_PRIORITY = (
+    (_STATE_MINIMIZED, 'minimized'),
+    (_STATE_HIDDEN, 'hidden'),
+    (_STATE_CLOAKED, 'cloaked'),
+    (_STATE_OFF_SCREEN, 'off-screen'),
+    (_STATE_MAXIMIZED, 'maximized'),
+)
+_STATE_TABLE = tuple(
+    next((name for bit, name in _STATE_PRIORITY if key & bit), 'normal')
+    for key in range(32)
+)
+
+
+# Toolhelp32 process snapshot (one kernel call for every pid -> exe name)
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', ctypes.wintypes.DWORD),
+        ('cntUsage', ctypes.wintypes.DWORD),
+        ('th32ProcessID', ctypes.wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_void_p),
+        ('th32ModuleID', ctypes.wintypes.DWORD),
+        ('cntThreads', ctypes.wintypes.DWORD),
+        ('th32ParentProcessID', ctypes.wintypes.DWORD),
+        ('pcPriClassBase', ctypes.c_long),
+        ('dwFlags', ctypes.wintypes.DWORD),
+        ('szExeFile', ctypes.c_wchar * 260),
+    ]
+
+
+def _snapshot_process_names():
+    """Return {pid: exe name} for every running process in one snapshot.
+
+    Returns an empty dict if the snapshot fails; callers fall back to
+    per-pid lookups.
+    """
+    try:
+        _load_kernel32()
+    except (AttributeError, OSError):
+        return {}
+    snap = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snap or snap == INVALID_HANDLE_VALUE:
+        return {}
+    names = {}
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = _kernel32.Process32FirstW(snap, ctypes.byref(entry))
+        while ok:
+            names[entry.th32ProcessID] = entry.szExeFile
+            ok = _kernel32.Process32NextW(snap, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snap)
+    return names
+
+
+# Typed user32/dwmapi entry points for the per-hwnd calls in _inspect_window.
+# Bound once on first use; pywin32's wrappers re-marshal arguments on every
+# call, which adds up across hundreds of windows per enumeration.
+_user32 = None
+_dwmapi = None
+_WNDENUMPROC = None
+
+# Window class names are at most 256 characters
+_CLASS_NAME_MAX = 257
+
+
+def _load_user32():
+    """Lazy-bind the user32/dwmapi functions used to inspect windows."""
+    global _user32, _dwmapi, _WNDENUMPROC
+    if _user32 is not None:
+        return
+    wintypes = ctypes.wintypes
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    dwmapi = ctypes.WinDLL('dwmapi')
+
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    user32.EnumWindows.argtypes = (_WNDENUMPROC, wintypes.LPARAM)
+    user32.EnumWindows.restype = wintypes.BOOL
+    user32.GetClassNameW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    user32.GetClassNameW.restype = ctypes.c_int
+    user32.GetWindowLongW.argtypes = (wintypes.HWND, ctypes.c_int)
+    user32.GetWindowLongW.restype = wintypes.LONG
+    user32.GetWindowTextLengthW.argtypes = (wintypes.HWND,)
+    user32.GetWindowTextLengthW.restype = ctypes.c_int
+    user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.IsWindowVisible.argtypes = (wintypes.HWND,)
+    user32.IsWindowVisible.restype = wintypes.BOOL
+    user32.GetWindowThreadProcessId.argtypes = (
+        wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.GetWindowRect.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.RECT))
+    user32.GetWindowRect.restype = wintypes.BOOL
+    dwmapi.DwmGetWindowAttribute.argtypes = (
+        wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD)
+    dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long  # HRESULT
+
+    _user32 = user32
+    _dwmapi = dwmapi
+
+
+def _window_thread_id(hwnd):
+    """Return the id of the thread that created hwnd (0 if it can't be read)."""
+    _load_user32()
+    return _user32.GetWindowThreadProcessId(hwnd, None)
+
+
+# Kernel32 entry points for the process snapshot and image-path lookups
+_kernel32 = None
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_INSUFFICIENT_BUFFER = 122
+
+
+def _load_kernel32():
+    """Lazy-bind the Toolhelp32 and process-query kernel32 functions.
+
+    Uses a private WinDLL so argtypes/restype never leak onto the shared
+    ctypes.windll.kernel32 other code may be using.
+    """
+    global _kernel32
+    if _kernel32 is not None:
+        return
+    wintypes = ctypes.wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = (
+        wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = (
+        wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD))
+    kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32 = kernel32
+
+
+def _query_image_path(pid):
+    """Return the full exe path of a process, or None if it can't be read.
+
+    One OpenProcess with limited-information access (granted for most
+    processes, even elevated ones) instead of a psutil.Process per lookup.
+    """
+    _load_kernel32()
+    handle = _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        for capacity in (1024, 32768):  # 32768: extended-length path limit
+            buf = ctypes.create_unicode_buffer(capacity)
+            size = ctypes.wintypes.DWORD(capacity)
+            if _kernel32.QueryFullProcessImageNameW(
+                    handle, 0, buf, ctypes.byref(size)):
+                return buf.value
+            if ctypes.get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+                return None
+        return None
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _top_level_hwnds():
+    """Return every top-level HWND (z-order) from one EnumWindows pass.
+
+    The callback only appends, so per-window inspection runs outside the
+    Win32 callback trampoline.
+    """
+    _load_user32()
+    hwnds = []
+
+    def collect(hwnd, _):
+        hwnds.append(hwnd)
+        return True
+
+    _user32.EnumWindows(_WNDENUMPROC(collect), 0)
+    return hwnds
 
 
 # Minimum sane window size -- windows smaller than this get restored
@@ -232,8 +466,12 @@ DEFAULT_RESTORE_HEIGHT = 600
 class WindowsPlatform(PlatformBase):
 
     def __init__(self):
+        # pywin32/psutil are loaded once here, not on every method entry
+        _load_win32()
         self._own_pid = os.getpid()
         self._vd_helper = None  # Lazy-init virtual desktop helper
+        self._monitor_cache = None
+        self._monitor_cache_ts = 0.0
 
     @property
     def vd_helper(self):
@@ -272,7 +510,6 @@ class WindowsPlatform(PlatformBase):
 
     def get_primary_monitor_work_area(self):
         """Return (x, y, width, height) of the primary monitor work area."""
-        _load_win32()
         # SystemParametersInfo with SPI_GETWORKAREA returns primary monitor work area
         # But using EnumDisplayMonitors is more reliable for multi-monitor
         monitors = self._get_all_monitors()
@@ -298,8 +535,15 @@ class WindowsPlatform(PlatformBase):
         return self.get_primary_monitor_work_area()
 
     def _get_all_monitors(self):
-        """Enumerate all monitors and their work areas."""
-        _load_win32()
+        """Enumerate all monitors and their work areas.
+
+        The layout rarely changes within a run, so the result is reused for
+        MONITOR_CACHE_TTL seconds; callers must not mutate it.
+        """
+        now = time.monotonic()
+        if (self._monitor_cache is not None
+                and now - self._monitor_cache_ts < MONITOR_CACHE_TTL):
+            return self._monitor_cache
         monitors = []
         # pywin32 EnumDisplayMonitors returns list of (hMonitor, hdcMonitor, rect)
         for hmonitor, _hdc, _rect in win32api.EnumDisplayMonitors(None, None):
@@ -310,102 +554,133 @@ class WindowsPlatform(PlatformBase):
                 'work_area': info['Work'],      # excludes taskbar
                 'primary': info['Flags'] & 1,   # MONITORINFOF_PRIMARY
             })
+        self._monitor_cache = monitors
+        self._monitor_cache_ts = now
         return monitors
 
     def enumerate_windows(self, include_hidden=False):
         """Enumerate all top-level windows, returning WindowInfo list."""
-        _load_win32()
         windows = []
-        monitors = self._get_all_monitors()
-
-        def enum_callback(hwnd, _):
+        # Flat (left, top, right, bottom) tuples for the per-window bounds test
+        monitors = tuple(tuple(mon['area']) for mon in self._get_all_monitors())
+        # Many windows share a process: resolve each pid once per pass
+        snapshot = _snapshot_process_names()
+        processes = {}
+
+        def process_info(pid):
+            info = processes.get(pid)
+            if info is None:
+                info = processes[pid] = self._get_process_info(
+                    pid, snapshot.get(pid))
+            return info
+
+        def inspect(hwnd, buf=None):
             try:
-                wi = self._inspect_window(hwnd, monitors, include_hidden)
-                if wi is not None:
-                    windows.append(wi)
+                return self._inspect_window(hwnd, monitors, include_hidden,
+                                            process_info, buf)
             except Exception as e:
                 logger.debug(f"Error inspecting hwnd {hwnd}: {e}")
-            return True
+                return None
 
-        win32gui.EnumWindows(enum_callback, None)
+        hwnds = _top_level_hwnds()
+        if len(hwnds) > ENUM_PARALLEL_THRESHOLD:
+            # The user32/DWM/psutil calls release the GIL, so inspections
+            # overlap. Each call gets its own text buffer; two workers may
+            # race to resolve the same pid, which only duplicates a lookup.
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=ENUM_WORKERS) as pool:
+                results = pool.map(inspect, hwnds)
+                windows = [wi for wi in results if wi is not None]
+        else:
+            buf = ctypes.create_unicode_buffer(_CLASS_NAME_MAX)
+            for hwnd in hwnds:
+                wi = inspect(hwnd, buf)
+                if wi is not None:
+                    windows.append(wi)
         return windows
 
-    def _inspect_window(self, hwnd, monitors, include_hidden):
-        """Inspect a single window and return WindowInfo or None if filtered."""
+    def _inspect_window(self, hwnd, monitors, include_hidden, process_info,
+                        buf=None):
+        """Inspect a single window and return WindowInfo or None if filtered.
+
+        monitors is a tuple of (left, top, right, bottom) monitor rects.
+        process_info maps a pid to (process_name, exe_path). buf is a unicode
+        buffer reused across calls for class names and titles.
+        """
+        user32 = _user32
+        if buf is None:
+            buf = ctypes.create_unicode_buffer(_CLASS_NAME_MAX)
+
         # Get class name first for fast filtering
-        try:
-            class_name = win32gui.GetClassName(hwnd)
-        except Exception:
+        if not user32.GetClassNameW(hwnd, buf, _CLASS_NAME_MAX):
             return None
+        class_name = buf.value
 
         if class_name in SYSTEM_CLASSES:
             return None
 
         # Get window style
-        style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-        ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        style = user32.GetWindowLongW(hwnd, GWL_STYLE)
+        ex_style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
 
         # Skip child windows (should have a parent)
-        if style & win32con.WS_CHILD:
+        if style & WS_CHILD:
+            return None
+
+        # Skip our own process. Must come before the title read: for our own
+        # windows GetWindowTextW sends WM_GETTEXT to the owning thread, which
+        # deadlocks when that thread is blocked waiting on an inspection pool.
+        pid_out = ctypes.wintypes.DWORD()
+        if not user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid_out)):
+            return None
+        pid = pid_out.value
+
+        if pid == self._own_pid:
             return None
 
         # Skip tool windows unless they have a title
-        title = win32gui.GetWindowText(hwnd)
-        if (ex_style & win32con.WS_EX_TOOLWINDOW) and not title:
+        title = self._get_window_text(hwnd, buf)
+        if (ex_style & WS_EX_TOOLWINDOW) and not title:
             return None
 
         # Check visibility
-        is_visible = win32gui.IsWindowVisible(hwnd)
-
-        # Check cloaked state (virtual desktop windows, suspended UWP apps, etc.)
-        cloaked_value = self._get_cloaked_state(hwnd)
-        is_cloaked = cloaked_value != 0
+        is_visible = bool(user32.IsWindowVisible(hwnd))
 
         # Determine if window should be included
         if not is_visible and not include_hidden:
             # Still include minimized windows (they're "not visible" but user wants them)
-            if not (style & win32con.WS_MINIMIZE):
+            if not (style & WS_MINIMIZE):
                 return None
 
         # Skip windows with no title and not visible (background system windows)
         if not title and not is_visible:
             return None
 
-        # Skip our own process
-        try:
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        except Exception:
-            return None
-
-        if pid == self._own_pid:
-            return None
+        # Check cloaked state (virtual desktop windows, suspended UWP apps, etc.)
+        # Queried only for windows that passed every filter above.
+        cloaked_value = self._get_cloaked_state(hwnd)
+        is_cloaked = cloaked_value != 0
 
-        # Get process name
-        process_name = self._get_process_name(pid)
+        process_name, exe_path = process_info(pid)
 
         # Get window rect
-        try:
-            rect = win32gui.GetWindowRect(hwnd)
-            x, y, right, bottom = rect
-            width = right - x
-            height = bottom - y
-        except Exception:
+        rect = ctypes.wintypes.RECT()
+        if user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            x, y = rect.left, rect.top
+            width = rect.right - x
+            height = rect.bottom - y
+        else:
             x, y, width, height = 0, 0, 0, 0
 
         # Determine state
         is_off_screen = self._is_off_screen(x, y, width, height, monitors)
-        if style & win32con.WS_MINIMIZE:
-            state = 'minimized'
-        elif not is_visible:
-            state = 'hidden'
-        elif is_cloaked:
-            state = 'cloaked'
-        elif is_off_screen:
-            state = 'off-screen'
-        elif style & win32con.WS_MAXIMIZE:
-            state = 'maximized'
-        else:
-            state = 'normal'
+        state = _STATE_TABLE[
+            (_STATE_MINIMIZED if style & WS_MINIMIZE else 0)
+            | (0 if is_visible else _STATE_HIDDEN)
+            | (_STATE_CLOAKED if is_cloaked else 0)
+            | (_STATE_OFF_SCREEN if is_off_screen else 0)
+            | (_STATE_MAXIMIZED if style & WS_MAXIMIZE else 0)
+        ]
 
         wi = WindowInfo(
             handle=hwnd,
@@ -418,11 +693,22 @@ class WindowsPlatform(PlatformBase):
             state=state,
             is_visible=is_visible,
         )
-        wi.exe_path = self._get_process_exe_path(pid)
+        wi.exe_path = exe_path
         wi.cloaked_type = cloaked_value
         wi.is_off_screen = is_off_screen
         return wi
 
+    @staticmethod
+    def _get_window_text(hwnd, buf):
+        """Return a window's title, reading into buf when it fits."""
+        length = _user32.GetWindowTextLengthW(hwnd)
+        if length <= 0:
+            return ''
+        if length >= len(buf):
+            buf = ctypes.create_unicode_buffer(length + 1)
+        _user32.GetWindowTextW(hwnd, buf, len(buf))
+        return buf.value
+
     def _get_cloaked_state(self, hwnd):
         """Return the DWM cloaked value for a window.
 
@@ -431,49 +717,48 @@ class WindowsPlatform(PlatformBase):
           2 (DWM_CLOAKED_SHELL)     - cloaked by the shell/OS (e.g., suspended UWP)
           4 (DWM_CLOAKED_INHERITED) - inherited from an ancestor
         """
-        try:
-            cloaked = ctypes.c_int(0)
-            ctypes.windll.dwmapi.DwmGetWindowAttribute(
-                hwnd, DWMWA_CLOAKED,
-                ctypes.byref(cloaked), ctypes.sizeof(cloaked)
-            )
-            return cloaked.value
-        except Exception:
-            return 0
+        _load_user32()
+        cloaked = ctypes.c_int(0)
+        hr = _dwmapi.DwmGetWindowAttribute(
+            hwnd, DWMWA_CLOAKED,
+            ctypes.byref(cloaked), ctypes.sizeof(cloaked)
+        )
+        return cloaked.value if hr == 0 else 0
 
     def _is_off_screen(self, x, y, width, height, monitors):
-        """Check if window rect doesn't intersect any monitor."""
+        """Check if window rect doesn't intersect any monitor.
+
+        monitors: iterable of (left, top, right, bottom) monitor rects.
+        """
         if width <= 0 or height <= 0:
             return True
-        for mon in monitors:
-            ma = mon['area']  # (left, top, right, bottom)
+        right, bottom = x + width, y + height
+        for left, top, mon_right, mon_bottom in monitors:
             # Check intersection
-            if (x < ma[2] and x + width > ma[0] and
-                    y < ma[3] and y + height > ma[1]):
+            if x < mon_right and right > left and y < mon_bottom and bottom > top:
                 return False
         return True
 
-    def _get_process_name(self, pid):
-        """Get process name from PID."""
-        _load_win32()
-        try:
-            proc = psutil.Process(pid)
-            return proc.name()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return f"<pid:{pid}>"
+    def _get_process_info(self, pid, name=None):
+        """Return (process_name, exe_path) for a PID.
 
-    def _get_process_exe_path(self, pid):
-        """Get full executable path from PID. Returns None on failure."""
-        _load_win32()
-        try:
-            proc = psutil.Process(pid)
-            return proc.exe()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
+        name: already-known process name (e.g. from the Toolhelp snapshot).
+        The exe path comes from QueryFullProcessImageNameW; a missing name is
+        taken from its basename, and psutil is only consulted when neither is
+        available. exe_path is None when it can't be read.
+        """
+        exe_path = _query_image_path(pid)
+        if not name and exe_path:
+            name = os.path.basename(exe_path)
+        if not name:
+            try:
+                name = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                name = f"<pid:{pid}>"
+        return name, exe_path
 
     def restore_window(self, window_info):
         """Restore a minimized window to normal state."""
-        _load_win32()
         try:
             win32gui.ShowWindow(window_info.handle, SW_RESTORE)
             return True
@@ -483,7 +768,6 @@ class WindowsPlatform(PlatformBase):
 
     def show_window(self, window_info):
         """Make a hidden window visible."""
-        _load_win32()
         try:
             win32gui.ShowWindow(window_info.handle, SW_SHOW)
             return True
@@ -493,9 +777,8 @@ class WindowsPlatform(PlatformBase):
 
     def hide_window(self, window_info):
         """Hide a visible window (reverse of show_window)."""
-        _load_win32()
         try:
-            win32gui.ShowWindow(window_info.handle, win32con.SW_HIDE)
+            win32gui.ShowWindow(window_info.handle, SW_HIDE)
             return True
         except Exception as e:
             logger.debug(f"Failed to hide {window_info.handle}: {e}")
@@ -520,14 +803,13 @@ class WindowsPlatform(PlatformBase):
         offset_x, offset_y: cascade offset from dead center for visual separation.
         Positions are clamped to the monitor work area.
         """
-        _load_win32()
         try:
-            # For minimized windows, restore first to get their real size
-            style = win32gui.GetWindowLong(window_info.handle, win32con.GWL_STYLE)
-            if style & win32con.WS_MINIMIZE:
+            # For minimized windows, restore first to get their real size.
+            # ShowWindow returns once the restore is done, so the rect read
+            # below is the restored one (snapped/arranged size included).
+            style = win32gui.GetWindowLong(window_info.handle, GWL_STYLE)
+            if style & WS_MINIMIZE:
                 win32gui.ShowWindow(window_info.handle, SW_RESTORE)
-                import time
-                time.sleep(0.05)  # Brief pause for restore to take effect
 
             # Get current window size (post-restore)
             rect = win32gui.GetWindowRect(window_info.handle)
@@ -559,12 +841,12 @@ class WindowsPlatform(PlatformBase):
             cx = max(target_x, min(cx, target_x + area_width - w))
             cy = max(target_y, min(cy, target_y + area_height - h))
 
-            z_order = win32con.HWND_TOP
+            z_order = HWND_TOP
             win32gui.SetWindowPos(
                 window_info.handle,
                 z_order,
                 cx, cy, w, h,
-                win32con.SWP_SHOWWINDOW
+                SWP_SHOWWINDOW
             )
             return True
         except Exception as e:
@@ -573,17 +855,16 @@ class WindowsPlatform(PlatformBase):
 
     def bring_to_front(self, window_info):
         """Bring window to front using AttachThreadInput workaround."""
-        _load_win32()
         try:
             fg_hwnd = win32gui.GetForegroundWindow()
             if fg_hwnd == window_info.handle:
                 return True
 
-            fg_thread = win32process.GetWindowThreadProcessId(fg_hwnd)[0]
-            target_thread = win32process.GetWindowThreadProcessId(window_info.handle)[0]
+            fg_thread = _window_thread_id(fg_hwnd)
+            target_thread = _window_thread_id(window_info.handle)
 
             attached = False
-            if fg_thread != target_thread:
+            if fg_thread and target_thread and fg_thread != target_thread:
                 try:
                     win32process.AttachThreadInput(fg_thread, target_thread, True)
                     attached = True